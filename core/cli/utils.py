@@ -0,0 +1,70 @@
+"""
+Shared output helpers for CLI commands.
+"""
+import json
+import sys
+from typing import Any
+
+_MISSING = object()
+
+def format_output_for_display(output: Any) -> Any:
+    """
+    Unwrap a standard ``{"success": ..., "data": ...}`` result for display.
+
+    Successful results show their data, failed results show their error
+    message, and anything else is returned unchanged.
+
+    Args:
+        output: A command or domain function result
+
+    Returns:
+        The value to display
+    """
+    # Exact dict check plus a single lookup keeps this cheap for every result
+    if type(output) is dict:
+        success = output.get("success", _MISSING)
+        if success is _MISSING:
+            return output
+        if success:
+            return output.get("data", output)
+        return f"ERROR: {output.get('error', 'Unknown error')}"
+    return output
+
+def format_output(result: Any) -> None:
+    """
+    Print a command result as JSON.
+
+    Standard success/error results are unwrapped first via
+    format_output_for_display.
+
+    Output is pretty-printed when stdout is a terminal and compact otherwise,
+    so piped output stays cheap to produce and easy to parse. orjson is used
+    when it is installed.
+
+    Args:
+        result: The value to print
+    """
+    value = format_output_for_display(result)
+    pretty = sys.stdout.isatty()
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        # Leave datetimes and dataclasses to default=str, as json.dumps does
+        option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                  | orjson.OPT_PASSTHROUGH_DATACLASS)
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            print(orjson.dumps(value, default=str, option=option).decode())
+            return
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the json module handles
+            pass
+
+    if pretty:
+        kwargs = {"indent": 2}
+    else:
+        kwargs = {"separators": (",", ":")}
+    print(json.dumps(value, default=str, **kwargs))
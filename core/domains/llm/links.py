@@ -4,7 +4,7 @@ Link handlers for the LLM domain
 import copy
 from typing import Dict, Any
 import logging
-from core.links import LinkHandler, register_link_type
+from core.links import LinkHandler, register_link_types
 from .functions import generate_text
 
 logger = logging.getLogger(__name__)
@@ -333,7 +333,8 @@ class LLMExtractToSchemaLink(LinkHandler):
         """
         try:
             import jsonschema
-            jsonschema.validate(instance=data, schema=schema)
+            from core.schemas import validate_instance
+            validate_instance(data, schema)
             return None
         except jsonschema.ValidationError as e:
             return str(e.message)
@@ -836,7 +837,8 @@ class LLMEnrichLink(LinkHandler):
         """
         try:
             import jsonschema
-            jsonschema.validate(instance=data, schema=schema)
+            from core.schemas import validate_instance
+            validate_instance(data, schema)
             return None
         except jsonschema.ValidationError as e:
             return str(e.message)
@@ -898,6 +900,8 @@ class LLMEnrichLink(LinkHandler):
 
 
 # Register the link types
-register_link_type("llm", LLMHandler)
-register_link_type("llm.extract_to_schema", LLMExtractToSchemaLink)
-register_link_type("llm.enrich", LLMEnrichLink)
+register_link_types({
+    "llm": LLMHandler,
+    "llm.extract_to_schema": LLMExtractToSchemaLink,
+    "llm.enrich": LLMEnrichLink,
+})
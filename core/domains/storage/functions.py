@@ -4,6 +4,7 @@ Functions for storage domain
 import logging
 import uuid
 import os
+import re
 import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -13,60 +14,24 @@ from .utils import ensure_directory, safe_load_json, safe_save_json  # Import fr
 
 logger = logging.getLogger(__name__)
 
-# Utility functions (moved from utils.py)
-def ensure_directory(directory_path: str) -> bool:
-    """
-    Ensure a directory exists, creating it if necessary.
-    """
-    try:
-        os.makedirs(directory_path, exist_ok=True)
-        return True
-    except Exception as e:
-        logger.error(f"Failed to create directory {directory_path}: {e}")
-        return False
-        
-def safe_load_json(file_path: str, default: Any = None) -> Any:
-    """
-    Safely load a JSON file, returning a default value if loading fails.
-    """
-    if not os.path.exists(file_path):
-        return default if default is not None else {}
-        
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Error loading JSON file {file_path}: {e}")
-        return default if default is not None else {}
-        
-def safe_save_json(file_path: str, data: Any, indent: int = 2) -> bool:
-    """
-    Safely save data to a JSON file.
-    """
-    try:
-        directory = os.path.dirname(file_path)
-        if directory:
-            ensure_directory(directory)
-            
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
-        return True
-    except Exception as e:
-        logger.error(f"Error saving JSON file {file_path}: {e}")
-        return False
-
 class Repository:
     """Repository for managing entities in a collection."""
     
-    def __init__(self, collection_name: str, adapter_name: str = "file"):
+    def __init__(self, collection_name: str, adapter_name: Optional[str] = None,
+                 adapter_options: Optional[Dict[str, Any]] = None):
         """
         Initialize a repository.
         
         Args:
             collection_name: Name of the collection
-            adapter_name: Name of the storage adapter to use
+            adapter_name: Name of the storage adapter to use. Defaults to
+                HOTTOPOTETO_STORAGE_ADAPTER, or "file" when that is unset.
+            adapter_options: Extra settings for the adapter, e.g.
+                {"indexed_fields": ["data.word"]} for the sqlite adapter
         """
         self.collection_name = collection_name
+        if adapter_name is None:
+            adapter_name = os.environ.get("HOTTOPOTETO_STORAGE_ADAPTER", "file")
         
         # Get adapter
         adapter_cls = StorageAdapter.get(adapter_name)
@@ -74,12 +39,16 @@ class Repository:
             raise ValueError(f"Storage adapter '{adapter_name}' not found")
             
         # Initialize adapter
-        self.adapter = adapter_cls(collection=collection_name)
+        self.adapter = adapter_cls(collection=collection_name, **(adapter_options or {}))
         
     def save(self, id: str, data: Dict[str, Any]) -> bool:
         """Save an entity with the given ID."""
         return self.adapter.save(id, data)
         
+    def save_many(self, entries: Dict[str, Dict[str, Any]]) -> bool:
+        """Save several entities keyed by ID, in one transaction where the adapter supports it."""
+        return self.adapter.save_many(entries)
+        
     def get(self, id: str) -> Optional[Dict[str, Any]]:
         """Get an entity by ID."""
         return self.adapter.get(id)
@@ -93,6 +62,20 @@ class Repository:
         filter_criteria = filter_criteria or {}
         return self.adapter.query(filter_criteria)
 
+    def close(self) -> None:
+        """Release the adapter's resources, such as an open database connection."""
+        self.adapter.close()
+        
+    def __enter__(self) -> "Repository":
+        return self
+        
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+# Characters not allowed in entity IDs built from filenames, along with any
+# hyphens next to them
+_ID_SEPARATOR_RE = re.compile(r'[^a-zA-Z0-9_]+')
+
 # Domain functions that leverage repository pattern
 def save_entity(collection: str, data: Dict[str, Any], metadata: Dict[str, Any] = None, filename: str = None) -> Dict[str, Any]:
     """
@@ -111,13 +94,10 @@ def save_entity(collection: str, data: Dict[str, Any], metadata: Dict[str, Any]
     
     # Generate entity ID - use filename if provided, otherwise auto-generate
     if filename:
-        # Sanitize filename: remove special chars, replace spaces with hyphens
-        import re
-        sanitized = re.sub(r'[^a-zA-Z0-9-_]', '-', filename)
-        sanitized = re.sub(r'-+', '-', sanitized)  # Replace multiple hyphens with single
-        entity_id = sanitized.strip('-')
+        # Sanitize filename: each run of special chars and hyphens becomes one hyphen
+        entity_id = _ID_SEPARATOR_RE.sub('-', filename).strip('-')
     else:
-        entity_id = f"{collection.lower()}-{str(uuid.uuid4())[:8]}"
+        entity_id = f"{collection.lower()}-{uuid.uuid4().hex[:8]}"
     
     entity = {
         "id": entity_id,
@@ -2,8 +2,9 @@
 Link handlers for the storage domain
 """
 from typing import Dict, Any, List, Optional
+import functools
 import logging
-from core.links import LinkHandler, register_link_type
+from core.links import LinkHandler, register_link_types
 # Update import to new location
 from .functions import Repository, save_entity, get_entity, query_entities, delete_entity
 import uuid
@@ -11,6 +12,29 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=2)
+def _environment(strict: bool):
+    """
+    Get the shared Jinja2 environment for storage templates.
+    
+    storage.save renders missing variables as empty strings (see
+    StorageSaveLink._extract_data); the other storage links use
+    StrictUndefined so that they raise instead.
+    """
+    from jinja2 import Environment, StrictUndefined
+    if strict:
+        return Environment(undefined=StrictUndefined, auto_reload=False)
+    return Environment(auto_reload=False)
+
+@functools.lru_cache(maxsize=1024)
+def _compile_template(source: str, strict: bool = True):
+    """Compile a template string once and reuse it for later renders."""
+    return _environment(strict).from_string(source)
+
+def _now() -> str:
+    """Current time as an ISO string, available to templates as now()."""
+    return datetime.now().isoformat()
+
 def generate_id(prefix: str = "") -> str:
     """Generate a unique ID, optionally with prefix"""
     uid = uuid.uuid4().hex[:8]
@@ -71,7 +95,7 @@ class StorageSaveLink(LinkHandler):
             to StrictUndefined would turn missing-variable warnings into
             exceptions, breaking recipes that intentionally write partial data.
         """
-        from jinja2 import Environment, UndefinedError
+        from jinja2 import UndefinedError
         
         # Handle None
         if data_source is None:
@@ -82,17 +106,13 @@ class StorageSaveLink(LinkHandler):
             # Only process if it looks like a template
             if "{{" in data_source and "}}" in data_source:
                 try:
-                    env = Environment()
-                    template = env.from_string(data_source)
+                    template = _compile_template(data_source, strict=False)
                     
                     # Add helper functions to context
-                    def now():
-                        return datetime.now().isoformat()
-                    
-                    context_with_funcs = {**context, "now": now}
-                    rendered = template.render(**context_with_funcs)
+                    rendered = template.render(context, now=_now)
                     
-                    logger.debug(f"Rendered template: '{data_source}' → '{rendered}'")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Rendered template: '{data_source}' → '{rendered}'")
                     return rendered
                     
                 except UndefinedError as e:
@@ -391,16 +411,17 @@ class StorageInitLink(LinkHandler):
             # Generate unique document ID
             doc_id = generate_id("doc")
             
-            # Create entity for storage
+            # Create entity for storage; both timestamps record the same moment
+            now = datetime.now().isoformat()
             entity = {
                 "id": doc_id,
                 "data": data,
                 "metadata": {
                     "schema": schema,
                     "collection": collection,
-                    "initialized_at": datetime.now().isoformat()
+                    "initialized_at": now
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now
             }
             
             # Save to repository
@@ -504,21 +525,12 @@ class StorageInitLink(LinkHandler):
         Uses StrictUndefined so that missing template variables raise
         UndefinedError rather than silently expanding to empty string.
         """
-        from jinja2 import Environment, StrictUndefined
-
         if data_source is None:
             return None
 
         if isinstance(data_source, str):
             if "{{" in data_source and "}}" in data_source:
-                def now():
-                    return datetime.now().isoformat()
-
-                env = Environment(undefined=StrictUndefined)
-                template = env.from_string(data_source)
-                context_with_funcs = {**context, "now": now}
-                rendered = template.render(**context_with_funcs)
-                return rendered
+                return _compile_template(data_source).render(context, now=_now)
             else:
                 return data_source
 
@@ -682,14 +694,15 @@ class StorageUpdateLink(LinkHandler):
                     }
             
             # Update metadata with timestamp
-            updated_metadata = {**metadata, "updated_at": datetime.now().isoformat()}
+            now = datetime.now().isoformat()
+            updated_metadata = {**metadata, "updated_at": now}
             
             # Create updated entity
             updated_entity = {
                 "id": document_id,
                 "data": updated_data,
                 "metadata": updated_metadata,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now
             }
             
             # Save updated document
@@ -730,10 +743,7 @@ class StorageUpdateLink(LinkHandler):
         if not isinstance(value, str) or "{{" not in value:
             return value
 
-        from jinja2 import Environment, StrictUndefined
-        env = Environment(undefined=StrictUndefined)
-        template = env.from_string(value)
-        return template.render(**context)
+        return _compile_template(value).render(context)
 
     @classmethod
     def _extract_data(cls, data_source: Any, context: Dict[str, Any]) -> Any:
@@ -743,21 +753,12 @@ class StorageUpdateLink(LinkHandler):
         Uses StrictUndefined so that missing template variables raise
         UndefinedError rather than silently expanding to empty string.
         """
-        from jinja2 import Environment, StrictUndefined
-
         if data_source is None:
             return None
 
         if isinstance(data_source, str):
             if "{{" in data_source and "}}" in data_source:
-                def now():
-                    return datetime.now().isoformat()
-
-                env = Environment(undefined=StrictUndefined)
-                template = env.from_string(data_source)
-                context_with_funcs = {**context, "now": now}
-                rendered = template.render(**context_with_funcs)
-                return rendered
+                return _compile_template(data_source).render(context, now=_now)
             else:
                 return data_source
 
@@ -820,7 +821,8 @@ class StorageUpdateLink(LinkHandler):
         """
         try:
             import jsonschema
-            jsonschema.validate(instance=data, schema=schema)
+            from core.schemas import validate_instance
+            validate_instance(data, schema)
             return None
         except jsonschema.ValidationError as e:
             return str(e.message)
@@ -868,9 +870,11 @@ class StorageUpdateLink(LinkHandler):
 
 
 # Register the link types
-register_link_type("storage.save", StorageSaveLink)
-register_link_type("storage.get", StorageGetLink)
-register_link_type("storage.query", StorageQueryLink)
-register_link_type("storage.delete", StorageDeleteLink)
-register_link_type("storage.init", StorageInitLink)
-register_link_type("storage.update", StorageUpdateLink)
+register_link_types({
+    "storage.save": StorageSaveLink,
+    "storage.get": StorageGetLink,
+    "storage.query": StorageQueryLink,
+    "storage.delete": StorageDeleteLink,
+    "storage.init": StorageInitLink,
+    "storage.update": StorageUpdateLink,
+})
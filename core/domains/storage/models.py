@@ -4,11 +4,15 @@ Model definitions for storage domain
 import os
 import json
 import logging
-from typing import Dict, List, Any, Optional, ClassVar, Type
-from pydantic import BaseModel, Field
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, ClassVar, Set, Tuple, Type
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 from core.models import GenericEntryModel
-from .utils import ensure_directory, safe_load_json, safe_save_json 
+from .utils import ensure_directory, safe_load_json, safe_save_json, dumps_json, loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +43,13 @@ class StorageAdapter(BaseModel):
         """Save data with the given ID"""
         raise NotImplementedError("Storage adapters must implement save method")
         
+    def save_many(self, entries: Dict[str, Dict[str, Any]]) -> bool:
+        """Save several entities, keyed by ID"""
+        # Adapters that can write a batch at once override this
+        return all([self.save(id, data) for id, data in entries.items()])
+
     def get(self, id: str) -> Optional[Dict[str, Any]]:
-        """Get data with the given ID"""
+        """Get data with the given ID, or None if there is no such entity"""
         raise NotImplementedError("Storage adapters must implement get method")
         
     def delete(self, id: str) -> bool:
@@ -50,7 +59,14 @@ class StorageAdapter(BaseModel):
     def query(self, filter_criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Query data with filter criteria"""
         raise NotImplementedError("Storage adapters must implement query method")
+
+    def close(self) -> None:
+        """Release any resources the adapter holds open"""
     
+    def _matches_criteria(self, entity: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
+        """Check if an entity matches the filter criteria"""
+        return _matches_paths(entity, _criteria_paths(criteria))
+
     @classmethod
     def register(cls, adapter_class: Type['StorageAdapter']) -> None:
         """Register an adapter implementation"""
@@ -66,10 +82,39 @@ class StorageAdapter(BaseModel):
         """List all registered adapters"""
         return list(cls._registry.keys())
 
+def _criteria_paths(criteria: Dict[str, Any]) -> List[Tuple[Tuple[str, ...], str, Any]]:
+    """Split dotted criteria keys into (parent keys, field, value), shallowest first.
+
+    Done once per query rather than once per entity, and ordered so the
+    cheap top-level comparisons can reject an entity before any nested
+    lookups run.
+    """
+    paths = []
+    for key, value in (criteria or {}).items():
+        *parents, field = key.split('.')
+        paths.append((tuple(parents), field, value))
+    paths.sort(key=lambda path: len(path[0]))
+    return paths
+
+def _matches_paths(entity: Dict[str, Any], paths: List[Tuple[Tuple[str, ...], str, Any]]) -> bool:
+    """Check if an entity matches criteria prepared by _criteria_paths"""
+    for parents, field, value in paths:
+        current = entity
+        for part in parents:
+            if part not in current:
+                return False
+            current = current[part]
+        if field not in current or current[field] != value:
+            return False
+    return True
+
 class FileAdapter(StorageAdapter):
     """File-based storage adapter"""
     name: str = "file"
     base_dir: str = Field(default="storage/data")
+    # Entity files are meant to be read by people, so they are indented by
+    # default; None writes compact JSON at roughly half the size
+    indent: Optional[int] = Field(default=2)
     
     def _get_file_path(self, id: str) -> str:
         """Get the file path for an entity"""
@@ -78,18 +123,24 @@ class FileAdapter(StorageAdapter):
     def save(self, id: str, data: Dict[str, Any]) -> bool:
         """Save data with the given ID"""
         file_path = self._get_file_path(id)
-        return safe_save_json(file_path, data)
+        _evict_entity(file_path)
+        return safe_save_json(file_path, data, indent=self.indent)
     
     def get(self, id: str) -> Optional[Dict[str, Any]]:
         """Get data with the given ID"""
         file_path = self._get_file_path(id)
-        return safe_load_json(file_path)
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return _copy_entity(_load_cached(file_path, stat))
             
     def delete(self, id: str) -> bool:
         """Delete data with the given ID"""
         file_path = self._get_file_path(id)
         if not os.path.exists(file_path):
             return False
+        _evict_entity(file_path)
         try:
             os.remove(file_path)
             return True
@@ -102,46 +153,298 @@ class FileAdapter(StorageAdapter):
         results = []
         collection_dir = os.path.join(self.base_dir, self.collection)
         
-        if not os.path.exists(collection_dir):
+        try:
+            with os.scandir(collection_dir) as it:
+                entries = [entry for entry in it if entry.name.endswith('.json')]
+        except FileNotFoundError:
             return []
                 
-        for filename in os.listdir(collection_dir):
-            if filename.endswith('.json'):
-                try:
-                    file_path = os.path.join(collection_dir, filename)
-                    entity = safe_load_json(file_path)
-                    
-                    # Apply filters
-                    if self._matches_criteria(entity, filter_criteria):
-                        results.append(entity)
-                except Exception as e:
-                    logger.error(f"Error processing file {filename}: {e}")
+        paths = _criteria_paths(filter_criteria)
+        for name, entity in _load_entities(collection_dir, entries):
+            try:
+                # Apply filters; only matches are copied out of the cache
+                if _matches_paths(entity, paths):
+                    results.append(_copy_entity(entity))
+            except Exception as e:
+                logger.error(f"Error processing file {name}: {e}")
                         
         return results
     
-    def _matches_criteria(self, entity: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
-        """Check if an entity matches the filter criteria"""
-        if not criteria:
+# Parsed entity files keyed by path, least recently used first. Each entry
+# records the file's mtime and size, so a query only re-reads files that
+# changed since they were last parsed instead of loading the whole
+# collection every time. Shared by all FileAdapters, since repositories
+# are created per call, and bounded so it can't grow with every file the
+# process ever reads.
+_entity_cache: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+# Cached paths grouped by directory, so a listing can drop its own missing
+# files without walking the whole cache
+_entity_dirs: Dict[str, Set[str]] = {}
+_entity_cache_lock = threading.Lock()
+_MAX_CACHED_ENTITIES = 4096
+_MISSING = object()
+
+def _cached_entity(path: str, stat: os.stat_result) -> Any:
+    """Get the cached parse of a file if it is still current, else _MISSING."""
+    with _entity_cache_lock:
+        cached = _entity_cache.get(path)
+        if cached is None or cached[0] != stat.st_mtime_ns or cached[1] != stat.st_size:
+            return _MISSING
+        _entity_cache.move_to_end(path)
+        return cached[2]
+
+def _forget_path(path: str) -> None:
+    """Remove a path from the directory index; the cache lock must be held."""
+    paths = _entity_dirs.get(os.path.dirname(path))
+    if paths is not None:
+        paths.discard(path)
+        if not paths:
+            del _entity_dirs[os.path.dirname(path)]
+
+def _cache_entity(path: str, stat: os.stat_result, entity: Any) -> None:
+    """Cache a parsed file, evicting the least recently used ones past the bound."""
+    with _entity_cache_lock:
+        _entity_cache[path] = (stat.st_mtime_ns, stat.st_size, entity)
+        _entity_cache.move_to_end(path)
+        _entity_dirs.setdefault(os.path.dirname(path), set()).add(path)
+        while len(_entity_cache) > _MAX_CACHED_ENTITIES:
+            _forget_path(_entity_cache.popitem(last=False)[0])
+
+def _evict_entity(path: str) -> None:
+    """Drop a file from the cache."""
+    with _entity_cache_lock:
+        if _entity_cache.pop(path, None) is not None:
+            _forget_path(path)
+
+def _evict_unlisted(directory: str, listed: Set[str]) -> None:
+    """Drop cached files in a directory that its latest listing no longer shows."""
+    with _entity_cache_lock:
+        paths = _entity_dirs.get(os.path.dirname(os.path.join(directory, "")))
+        if not paths:
+            return
+        for path in paths - listed:
+            del _entity_cache[path]
+            _forget_path(path)
+
+def _load_cached(path: str, stat: os.stat_result) -> Any:
+    """Load an entity file, reusing the parsed copy while the file is unchanged."""
+    entity = _cached_entity(path, stat)
+    if entity is _MISSING:
+        entity = safe_load_json(path)
+        _cache_entity(path, stat, entity)
+    return entity
+
+def _copy_entity(entity: Any) -> Any:
+    """Copy a cached entity so callers can't mutate the cache.
+
+    Entities came from JSON, so a JSON round trip is a full copy, and with
+    orjson it is quicker than copy.deepcopy.
+    """
+    return loads_json(dumps_json(entity))
+
+# Below this many files to (re)load, a thread pool costs more than it saves
+_PARALLEL_LOAD_MIN = 32
+
+def _load_entities(directory: str, entries: List[os.DirEntry]) -> List[Tuple[str, Any]]:
+    """Load a directory's entity files as (file name, entity) pairs in listing order.
+
+    Unchanged files come from the cache. Files that are new or changed are
+    read on a thread pool when there are enough of them, since the reads
+    wait on I/O outside the GIL. Cached files that are no longer listed,
+    e.g. because they were deleted by hand, are dropped.
+    """
+    _evict_unlisted(directory, {entry.path for entry in entries})
+    loaded: Dict[str, Any] = {}
+    stale = []
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except OSError as e:
+            logger.error(f"Error processing file {entry.name}: {e}")
+            continue
+        entity = _cached_entity(entry.path, stat)
+        if entity is _MISSING:
+            stale.append((entry.path, stat))
+        else:
+            loaded[entry.path] = entity
+
+    stale_paths = [path for path, _ in stale]
+    if len(stale) >= _PARALLEL_LOAD_MIN:
+        with ThreadPoolExecutor(max_workers=min(32, len(stale))) as pool:
+            parsed = list(pool.map(safe_load_json, stale_paths))
+    else:
+        parsed = [safe_load_json(path) for path in stale_paths]
+    for (path, stat), entity in zip(stale, parsed):
+        _cache_entity(path, stat, entity)
+        loaded[path] = entity
+
+    return [(entry.name, loaded[entry.path]) for entry in entries if entry.path in loaded]
+
+def _open_sqlite(db_path: str) -> sqlite3.Connection:
+    """Open a database connection, creating the entries table on first use."""
+    directory = os.path.dirname(db_path)
+    if directory:
+        ensure_directory(directory)
+    # The owning adapter serialises access with its lock, so the connection
+    # may be used from whichever thread calls it
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS entries ("
+        "collection TEXT NOT NULL, id TEXT NOT NULL, data TEXT NOT NULL, "
+        "updated_at TEXT NOT NULL, PRIMARY KEY (collection, id))"
+    )
+    conn.commit()
+    return conn
+
+def _json_path_literal(key: str) -> Optional[str]:
+    """Quote a dotted criteria key as a JSON path SQL literal.
+
+    Each segment is double-quoted so that characters with meaning in JSON
+    paths, such as "[" or "$", are read as part of the key. SQLite has no
+    escape for a double quote inside a quoted segment, so keys containing
+    one return None and are left to the Python filter.
+
+    The path is written into the statement rather than bound as a
+    parameter so that SQLite can match it against expression indexes.
+    """
+    segments = key.split('.')
+    if any('"' in segment for segment in segments):
+        return None
+    path = "$" + "".join(f'."{segment}"' for segment in segments)
+    return "'" + path.replace("'", "''") + "'"
+
+class SQLiteAdapter(StorageAdapter):
+    """SQLite-backed storage adapter.
+
+    Every collection lives in one database file, one row per entity, so
+    lookups go through the primary key index and queries are a single
+    SELECT instead of opening every file in a directory.
+    """
+    name: str = "sqlite"
+    db_path: str = Field(default="storage/data/storage.db")
+    # Dotted field paths to keep an expression index on, for fields that
+    # are queried often
+    indexed_fields: List[str] = Field(default_factory=list)
+
+    # Opened on first use and held until close()
+    _connection: Optional[sqlite3.Connection] = PrivateAttr(default=None)
+    _lock: Any = PrivateAttr(default_factory=threading.RLock)
+
+    def model_post_init(self, __context: Any) -> None:
+        for field in self.indexed_fields:
+            path = _json_path_literal(field)
+            if path is None:
+                raise ValueError(f"Cannot index field '{field}': double quotes are not supported")
+            with self._lock:
+                self._conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS "entries_{field.encode().hex()}" '
+                    f"ON entries (collection, json_extract(data, {path}))"
+                )
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """The adapter's connection; callers must hold self._lock"""
+        if self._connection is None:
+            self._connection = _open_sqlite(self.db_path)
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database connection; it is reopened if the adapter is used again"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _get_file_path(self, id: str) -> str:
+        """Get the file path for an entity (the shared database file)"""
+        return self.db_path
+
+    def save(self, id: str, data: Dict[str, Any]) -> bool:
+        """Save data with the given ID"""
+        return self.save_many({id: data})
+
+    def save_many(self, entries: Dict[str, Dict[str, Any]]) -> bool:
+        """Save several entities in a single transaction"""
+        now = datetime.now().isoformat()
+        rows = [
+            (self.collection, id, dumps_json(data).decode("utf-8"), now)
+            for id, data in entries.items()
+        ]
+        try:
+            with self._lock, self._conn as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries (collection, id, data, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
             return True
-            
-        for key, value in criteria.items():
-            if '.' in key:
-                # Handle nested fields
-                parts = key.split('.')
-                current = entity
-                for part in parts[:-1]:
-                    if part not in current:
-                        return False
-                    current = current[part]
-                if parts[-1] not in current or current[parts[-1]] != value:
-                    return False
-            elif key not in entity or entity[key] != value:
-                return False
-                
-        return True
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.error(f"Error saving to {self.db_path}: {e}")
+            return False
+
+    def get(self, id: str) -> Optional[Dict[str, Any]]:
+        """Get data with the given ID"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM entries WHERE collection = ? AND id = ?",
+                (self.collection, id),
+            ).fetchone()
+        return loads_json(row[0]) if row else None
+
+    def delete(self, id: str) -> bool:
+        """Delete data with the given ID"""
+        try:
+            with self._lock, self._conn as conn:
+                cursor = conn.execute(
+                    "DELETE FROM entries WHERE collection = ? AND id = ?",
+                    (self.collection, id),
+                )
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting {id} from {self.db_path}: {e}")
+            return False
+
+    def query(self, filter_criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Query data with filter criteria"""
+        # Scalar criteria are pushed into SQL with json_extract; anything
+        # else (booleans, lists, dicts) is checked in Python on the rows
+        # the SQL filter lets through. json_extract returns objects and
+        # arrays as JSON text, so string criteria also check the value's
+        # type to avoid matching that text.
+        clauses = ["collection = ?"]
+        params: List[Any] = [self.collection]
+        remaining = {}
+        for key, value in (filter_criteria or {}).items():
+            path = _json_path_literal(key)
+            if path is None:
+                remaining[key] = value
+            elif isinstance(value, str):
+                clauses.append(f"json_extract(data, {path}) = ?")
+                clauses.append(f"json_type(data, {path}) NOT IN ('object', 'array')")
+                params.append(value)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                clauses.append(f"json_extract(data, {path}) = ?")
+                params.append(value)
+            elif value is None:
+                clauses.append(f"json_type(data, {path}) = 'null'")
+            else:
+                remaining[key] = value
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM entries WHERE {' AND '.join(clauses)} ORDER BY id",
+                params,
+            ).fetchall()
+        results = [loads_json(data) for (data,) in rows]
+        if remaining:
+            results = [r for r in results if self._matches_criteria(r, remaining)]
+        return results
 
 # Register adapter implementations
 StorageAdapter.register(FileAdapter)
+StorageAdapter.register(SQLiteAdapter)
 
 # Register schemas with domain schema registry
 from core.registration import register_domain_schema
@@ -3,11 +3,43 @@ Utility functions for storage domain
 """
 import os
 import json
+import uuid
 import logging
-from typing import Any
+import contextlib
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+def dumps_json(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes, using orjson when it is installed.
+    
+    JSON has no NaN or Infinity. orjson writes them as null, while the
+    stdlib encoder raises ValueError for them rather than emit tokens that
+    orjson can't read back. Store such values as strings if they matter.
+    """
+    # orjson only knows a 2-space indent and rejects non-string keys, so
+    # anything else goes through the stdlib encoder
+    if orjson is not None and indent in (None, 2):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+def loads_json(data: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def ensure_directory(directory_path: str) -> bool:
     """
     Ensure a directory exists, creating it if necessary.
@@ -27,8 +59,8 @@ def safe_load_json(file_path: str, default: Any = None) -> Any:
         return default if default is not None else {}
         
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return loads_json(f.read())
     except Exception as e:
         logger.error(f"Error loading JSON file {file_path}: {e}")
         return default if default is not None else {}
@@ -36,15 +68,24 @@ def safe_load_json(file_path: str, default: Any = None) -> Any:
 def safe_save_json(file_path: str, data: Any, indent: int = 2) -> bool:
     """
     Safely save data to a JSON file.
+    
+    The data is written to a temporary file next to the target and then
+    renamed over it, so a crash mid-write leaves the previous version
+    intact rather than a truncated file.
     """
+    tmp_path = f"{file_path}.tmp-{uuid.uuid4().hex}"
     try:
         directory = os.path.dirname(file_path)
         if directory:
             ensure_directory(directory)
             
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        payload = dumps_json(data, indent=indent)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
         return True
     except Exception as e:
         logger.error(f"Error saving JSON file {file_path}: {e}")
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
         return False
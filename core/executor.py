@@ -1,17 +1,25 @@
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Any, Optional
 import yaml
 import os
+import sys
 import json
 import re
 import random
 import logging
-import execjs
-from datetime import datetime
-from langchain_openai import ChatOpenAI
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateError, TemplateNotFound
-from jsonschema import validate, ValidationError
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateNotFound
+from jsonschema import ValidationError
+from core.schemas import validate_instance
 from pydantic import BaseModel, Field
-from core.utils import ensure_directory  # Updated import path
+
+# Use libyaml's parser when PyYAML was built with it; it is much faster than
+# the pure-Python loader on large recipes
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+# langchain_openai and execjs are slow to import and only needed when a link
+# actually calls an LLM or runs JavaScript, so they are imported where used.
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -30,6 +38,79 @@ logging.Logger.trace = trace
 MAX_CONVERSATION_LENGTH = 15
 TEMPLATE_DIR = "templates/text"  # Default directory
 
+# User input validators
+# Each validator takes (value, input_config) and returns (ok, converted_value_or_error)
+def _validate_string_input(value: str, input_config: Dict[str, Any]):
+    """Accept any string as-is."""
+    return True, value
+
+def _validate_number_input(value: str, input_config: Dict[str, Any]):
+    """Convert the input to a float."""
+    try:
+        return True, float(value)
+    except ValueError:
+        return False, "Please enter a valid number."
+
+def _validate_boolean_input(value: str, input_config: Dict[str, Any]):
+    """Convert yes/no style answers to a boolean."""
+    value = value.lower()
+    if value in ('yes', 'y', 'true', '1'):
+        return True, True
+    if value in ('no', 'n', 'false', '0'):
+        return True, False
+    return False, "Please enter 'yes' or 'no'."
+
+def _validate_select_input(value: str, input_config: Dict[str, Any]):
+    """Map a 1-based option number to the option value."""
+    options = input_config['options']
+    try:
+        idx = int(value) - 1
+    except ValueError:
+        return False, "Please enter a valid number"
+    if 0 <= idx < len(options):
+        return True, options[idx]['value']
+    return False, f"Please enter a number between 1 and {len(options)}"
+
+def _validate_multiselect_input(value: str, input_config: Dict[str, Any]):
+    """Map comma-separated 1-based option numbers to a list of option values."""
+    options = input_config['options']
+    try:
+        indices = [int(idx.strip()) - 1 for idx in value.split(',')]
+    except ValueError:
+        return False, "Please enter valid comma-separated numbers"
+    if all(0 <= idx < len(options) for idx in indices):
+        return True, [options[idx]['value'] for idx in indices]
+    return False, f"Please enter valid numbers between 1 and {len(options)}"
+
+_INPUT_VALIDATORS = {
+    'string': _validate_string_input,
+    'number': _validate_number_input,
+    'boolean': _validate_boolean_input,
+    'select': _validate_select_input,
+    'multiselect': _validate_multiselect_input,
+}
+
+def _stdin_line_reader():
+    """
+    Return a callable with the same signature as input().
+
+    Interactive sessions use input() directly. When stdin is piped, it is
+    read in a single call and lines are handed out one at a time without
+    echoing prompts, raising EOFError once they run out (matching input()).
+    """
+    if sys.stdin.isatty():
+        return input
+
+    lines = iter(sys.stdin.read().splitlines())
+
+    def read_line(prompt: str = "") -> str:
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError("No more input available on stdin")
+
+    return read_line
+
 # Model classes for output types
 class RecipeLinkOutput(BaseModel):
     """Base class for recipe link outputs."""
@@ -62,6 +143,20 @@ class FunctionOutput(RecipeLinkOutput):
     """Output schema for function link."""
     pass
 
+# Patterns used by the JSON repair helpers below, compiled once
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+_JSON_ARRAY_RE = re.compile(r"\[[\s\S]*?\]")
+_FENCE_OPEN_RE = re.compile(r"```(?:json)?\s*")
+_FENCE_CLOSE_RE = re.compile(r"\s*```")
+_TRAILING_COMMA_RE = re.compile(r",\s*([\}\]])")
+_TRAILING_COMMA_OBJ_RE = re.compile(r",\s*}")
+_TRAILING_COMMA_ARR_RE = re.compile(r",\s*\]")
+_LINE_COMMENT_RE = re.compile(r"//.*?$", re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_UNQUOTED_KEY_RE = re.compile(r"([{,])\s*([a-zA-Z0-9_]+)\s*:")
+_UNQUOTED_IDENTIFIER_KEY_RE = re.compile(r"([{,])\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:")
+_JSON_DECODER = json.JSONDecoder()
+
 def attempt_fix_truncated_json(text: str) -> str:
     """
     Try to fix truncated or malformed JSON.
@@ -117,14 +212,14 @@ def fix_common_json_errors(text: str) -> str:
     fixed = text
     
     # Fix trailing commas first (safe operation)
-    fixed = re.sub(r',\s*([\}\]])', r'\1', fixed)
+    fixed = _TRAILING_COMMA_RE.sub(r'\1', fixed)
     
     # Fix JavaScript-style comments
-    fixed = re.sub(r'//.*?$', '', fixed, flags=re.MULTILINE)
-    fixed = re.sub(r'/\*.*?\*/', '', fixed, flags=re.DOTALL)
+    fixed = _LINE_COMMENT_RE.sub('', fixed)
+    fixed = _BLOCK_COMMENT_RE.sub('', fixed)
     
     # Fix unquoted keys (but don't touch already quoted keys)
-    fixed = re.sub(r'([{,])\s*([a-zA-Z0-9_]+)\s*:', r'\1"\2":', fixed)
+    fixed = _UNQUOTED_KEY_RE.sub(r'\1"\2":', fixed)
     
     return fixed
 
@@ -144,7 +239,8 @@ def extract_json(text: str) -> str:
         logger.trace("Input is already a dictionary, converting to JSON string")
         return json.dumps(text)
     
-    logger.trace(f"🔍 Attempting to extract JSON from text: {text[:200]}...")
+    if logger.isEnabledFor(TRACE):
+        logger.trace(f"🔍 Attempting to extract JSON from text: {text[:200]}...")
         
     # Return empty dict for empty input
     if not text or not text.strip():
@@ -166,12 +262,12 @@ def extract_json(text: str) -> str:
         
     # STRATEGY 2: Extract from markdown code blocks
     logger.trace("Trying to extract JSON from code blocks")
-    code_block_pattern = r"```(?:json)?\s*([\s\S]*?)\s*```"
-    code_block_match = re.search(code_block_pattern, text)
+    code_block_match = _CODE_BLOCK_RE.search(text)
     if (code_block_match):
         try:
             json_text = code_block_match.group(1)
-            logger.trace(f"Found code block: {json_text[:100]}...")
+            if logger.isEnabledFor(TRACE):
+                logger.trace(f"Found code block: {json_text[:100]}...")
             json.loads(json_text)
             logger.trace("JSON in code block is valid")
             return json_text
@@ -179,27 +275,31 @@ def extract_json(text: str) -> str:
             logger.trace("JSON parsing from code block failed")
             pass
             
-    # STRATEGY 3: Extract JSON object with regex
-    logger.trace("Trying to extract JSON object with regex")
-    json_obj_matches = re.finditer(r"\{[\s\S]*?\}", text)
-    for match in json_obj_matches:
+    # STRATEGY 3: Extract the first complete JSON object. raw_decode parses
+    # from each "{" in turn and stops where the object ends, so nested
+    # objects are found in one parse instead of trying every lazy
+    # {...} regex match.
+    logger.trace("Trying to extract JSON object with raw_decode")
+    start = text.find("{")
+    while start != -1:
         try:
-            json_text = match.group(0)
-            logger.trace(f"Found potential JSON object: {json_text[:100]}...")
-            json.loads(json_text)
-            logger.trace("Found valid JSON object")
+            _, end = _JSON_DECODER.raw_decode(text, start)
+            json_text = text[start:end]
+            if logger.isEnabledFor(TRACE):
+                logger.trace(f"Found valid JSON object: {json_text[:100]}...")
             return json_text
         except json.JSONDecodeError:
-            logger.trace("JSON object not valid, trying next match")
-            continue
+            start = text.find("{", start + 1)
+    logger.trace("No valid JSON object found")
     
     # STRATEGY 4: Extract JSON array with regex
     logger.trace("Trying to extract JSON array with regex")
-    json_array_match = re.search(r"\[[\s\S]*?\]", text)
+    json_array_match = _JSON_ARRAY_RE.search(text)
     if json_array_match:
         try:
             json_text = json_array_match.group(0)
-            logger.trace(f"Found potential JSON array: {json_text[:100]}...")
+            if logger.isEnabledFor(TRACE):
+                logger.trace(f"Found potential JSON array: {json_text[:100]}...")
             json.loads(json_text)
             logger.trace("Found valid JSON array")
             return json_text
@@ -214,20 +314,20 @@ def extract_json(text: str) -> str:
     # Remove markdown fences if any left
     if "```" in fixed_text:
         logger.trace("Removing markdown code fences")
-        fixed_text = re.sub(r'```(?:json)?\s*', '', fixed_text)
-        fixed_text = re.sub(r'\s*```', '', fixed_text)
+        fixed_text = _FENCE_OPEN_RE.sub('', fixed_text)
+        fixed_text = _FENCE_CLOSE_RE.sub('', fixed_text)
     
     # Fix trailing commas in objects
     logger.trace("Fixing trailing commas in objects")
-    fixed_text = re.sub(r",\s*}", "}", fixed_text)
+    fixed_text = _TRAILING_COMMA_OBJ_RE.sub("}", fixed_text)
     
     # Fix trailing commas in arrays
     logger.trace("Fixing trailing commas in arrays")
-    fixed_text = re.sub(r",\s*\]", "]", fixed_text)
+    fixed_text = _TRAILING_COMMA_ARR_RE.sub("]", fixed_text)
     
     # Add quotes around unquoted keys
     logger.trace("Adding quotes around unquoted keys")
-    fixed_text = re.sub(r'([{,])\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:', r'\1"\2":', fixed_text)
+    fixed_text = _UNQUOTED_IDENTIFIER_KEY_RE.sub(r'\1"\2":', fixed_text)
     
     # Try parsing the fixed text
     try:
@@ -303,14 +403,45 @@ class FunctionRegistry:
         return cls._functions[name]['function']
 
 # Main executor class
+def load_recipe_file(path: str) -> Dict[str, Any]:
+    """
+    Parse a recipe file, using the fastest parser available.
+    
+    ``.json`` recipes skip YAML entirely and are parsed with orjson when it
+    is installed, falling back to the json module. Everything else is parsed
+    as YAML with YamlSafeLoader.
+    
+    Args:
+        path: Path to the recipe file
+        
+    Returns:
+        The parsed recipe
+    """
+    if path.endswith(".json"):
+        try:
+            import orjson
+        except ImportError:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=YamlSafeLoader)
+
 class RecipeExecutor:
     """
     Generic recipe executor that executes a sequence of links defined in a recipe.
     The executor maintains a context that allows links to share data.
     """
     
-    def __init__(self, recipe_path: str, domain: str = None):
-        """Initialize with recipe path and optional domain."""
+    def __init__(self, recipe_path: str, domain: str = None, recipe: Optional[Dict[str, Any]] = None):
+        """
+        Initialize with recipe path and optional domain.
+        
+        If the caller has already parsed the recipe it can be passed as
+        ``recipe`` to skip reading the file again.
+        """
         self.recipe_path = recipe_path
         
         # Allow both old-style and new-style paths
@@ -320,9 +451,11 @@ class RecipeExecutor:
             if os.path.exists(alt_path):
                 self.recipe_path = alt_path
         
-        # Load the recipe
-        with open(self.recipe_path, 'r') as f:
-            self.recipe = yaml.safe_load(f)
+        # Load the recipe unless it was already parsed
+        if recipe is not None:
+            self.recipe = recipe
+        else:
+            self.recipe = load_recipe_file(self.recipe_path)
             
         # Determine domain from recipe if not specified
         self.domain = domain or self.recipe.get("domain", "generic")
@@ -346,6 +479,9 @@ class RecipeExecutor:
         # Initialize memory for storing link outputs
         self.memory = {}
         
+        # Reader for user input links, created on first use
+        self._read_line = None
+        
         # Initialize function registry with default functions
         # TODO: make this configurable/scalable with a broad set of standard functions
         self.function_registry = {
@@ -493,9 +629,11 @@ class RecipeExecutor:
                 }
             
             # Additional debug logging
-            logger.trace(f"Context for {key}: {context[key]}")
+            if logger.isEnabledFor(TRACE):
+                logger.trace(f"Context for {key}: {context[key]}")
 
-        logger.trace(f"Built context with keys: {list(context.keys())}")
+        if logger.isEnabledFor(TRACE):
+            logger.trace(f"Built context with keys: {list(context.keys())}")
         return context
 
     def _execute_user_input_link(self, link: Dict[str, Any]) -> UserInputOutput:
@@ -505,6 +643,10 @@ class RecipeExecutor:
         
         base_context = self.build_context(self.memory)
         
+        if self._read_line is None:
+            self._read_line = _stdin_line_reader()
+        read_line = self._read_line
+        
         for input_name, input_config in link['inputs'].items():
             # Process description template
             raw_description = input_config['description']
@@ -516,108 +658,44 @@ class RecipeExecutor:
                 prompt_text = raw_description + ": "
             
             input_type = input_config.get('type', 'string')
+            validator = _INPUT_VALIDATORS.get(input_type)
+            if validator is None:
+                continue
             
-            if input_type == 'string':
-                inputs[input_name] = input(prompt_text)
-                
-            elif input_type == 'number':
-                while True:
-                    try:
-                        value = input(prompt_text)
-                        inputs[input_name] = float(value)
-                        break
-                    except ValueError:
-                        print("Please enter a valid number.")
-                        
-            elif input_type == 'boolean':
-                while True:
-                    value = input(prompt_text + "(yes/no): ").lower()
-                    if value in ['yes', 'y', 'true', '1']:
-                        inputs[input_name] = True
-                        break
-                    elif value in ['no', 'n', 'false', '0']:
-                        inputs[input_name] = False
-                        break
-                    print("Please enter 'yes' or 'no'.")
-                    
-            elif input_type == 'select':
+            if input_type in ('select', 'multiselect'):
                 if 'options' not in input_config:
-                    logging.error(f"No options provided for select input {input_name}")
-                    inputs[input_name] = ""
+                    logging.error(f"No options provided for {input_type} input {input_name}")
+                    inputs[input_name] = "" if input_type == 'select' else []
                     continue
-                    
-                options = []
-                # Process template in each option
-                for option in input_config['options']:
-                    processed_option = {'value': option['value'], 'description': option.get('description', '')}
-                    
-                    # Process value template
-                    if isinstance(processed_option['value'], str) and '{{' in processed_option['value']:
-                        try:
-                            value_template = self.env.from_string(processed_option['value'])
-                            processed_option['value'] = value_template.render(**base_context)
-                        except Exception as e:
-                            logging.error(f"Error rendering option value: {e}")
-                    
-                    # Process description template
-                    if isinstance(processed_option['description'], str) and '{{' in processed_option['description']:
-                        try:
-                            desc_template = self.env.from_string(processed_option['description'])
-                            processed_option['description'] = desc_template.render(**base_context)
-                        except Exception as e:
-                            logging.error(f"Error rendering option description: {e}")
-                    
-                    options.append(processed_option)
-                    
-                print(f"\n{prompt_text}")
                 
-                # Display options with numbers
-                for i, option in enumerate(options, 1):
-                    desc = option.get('description', '')
-                    print(f"{i}. {option['value']}{' - ' + desc if desc else ''}")
-                    
-                # Get valid selection
-                while True:
-                    try:
-                        selection = input("\nEnter number of your choice: ")
-                        idx = int(selection) - 1
-                        if 0 <= idx < len(options):
-                            inputs[input_name] = options[idx]['value']
-                            break
-                        else:
-                            print(f"Please enter a number between 1 and {len(options)}")
-                    except ValueError:
-                        print("Please enter a valid number")
-                        
-            elif input_type == 'multiselect':
-                # For selecting multiple options
-                if 'options' not in input_config:
-                    logging.error(f"No options provided for multiselect input {input_name}")
-                    inputs[input_name] = []
-                    continue
-                    
                 options = input_config['options']
+                if input_type == 'select':
+                    options = [self._render_select_option(option, base_context) for option in options]
+                    input_config = {**input_config, 'options': options}
+                    
                 print(f"\n{prompt_text}")
                 
                 # Display options with numbers
                 for i, option in enumerate(options, 1):
                     desc = option.get('description', '')
                     print(f"{i}. {option['value']}{' - ' + desc if desc else ''}")
-                    
-                # Get valid selections
-                while True:
-                    try:
-                        selection = input("\nEnter numbers of your choices (comma-separated, e.g., '1,3,4'): ")
-                        indices = [int(idx.strip()) - 1 for idx in selection.split(',')]
-                        
-                        # Validate all indices
-                        if all(0 <= idx < len(options) for idx in indices):
-                            inputs[input_name] = [options[idx]['value'] for idx in indices]
-                            break
-                        else:
-                            print(f"Please enter valid numbers between 1 and {len(options)}")
-                    except ValueError:
-                        print("Please enter valid comma-separated numbers")
+                
+                if input_type == 'select':
+                    prompt = "\nEnter number of your choice: "
+                else:
+                    prompt = "\nEnter numbers of your choices (comma-separated, e.g., '1,3,4'): "
+            elif input_type == 'boolean':
+                prompt = prompt_text + "(yes/no): "
+            else:
+                prompt = prompt_text
+            
+            # Keep asking until the validator accepts the value
+            while True:
+                ok, value_or_error = validator(read_line(prompt), input_config)
+                if ok:
+                    inputs[input_name] = value_or_error
+                    break
+                print(value_or_error)
         
         # Process through LLM for validation and enhancement
         output_schema_obj = {
@@ -639,6 +717,7 @@ Return ONLY valid JSON.
 """
         # Direct LLM invocation
         try:
+            from langchain_openai import ChatOpenAI
             llm = ChatOpenAI(model_name="gpt-4o", temperature=0.0, max_tokens=500)
             response = llm.invoke(llm_prompt)
             raw_result = response.content
@@ -646,7 +725,7 @@ Return ONLY valid JSON.
             # Extract and validate JSON
             extracted = extract_json(raw_result)
             parsed = json.loads(extracted)
-            validate(instance=parsed, schema=output_schema_obj)
+            validate_instance(instance=parsed, schema=output_schema_obj)
             
             return UserInputOutput(data=parsed)
         except Exception as e:
@@ -654,6 +733,28 @@ Return ONLY valid JSON.
             # Fallback: return raw inputs
             return UserInputOutput(data=inputs)
 
+    def _render_select_option(self, option: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """Render templates in a select option's value and description."""
+        processed_option = {'value': option['value'], 'description': option.get('description', '')}
+        
+        # Process value template
+        if isinstance(processed_option['value'], str) and '{{' in processed_option['value']:
+            try:
+                value_template = self.env.from_string(processed_option['value'])
+                processed_option['value'] = value_template.render(**context)
+            except Exception as e:
+                logging.error(f"Error rendering option value: {e}")
+        
+        # Process description template
+        if isinstance(processed_option['description'], str) and '{{' in processed_option['description']:
+            try:
+                desc_template = self.env.from_string(processed_option['description'])
+                processed_option['description'] = desc_template.render(**context)
+            except Exception as e:
+                logging.error(f"Error rendering option description: {e}")
+        
+        return processed_option
+
     def _execute_function_link(self, link: Dict[str, Any]) -> FunctionOutput:
         """Execute a function link in the recipe."""
         logging.info(f"Executing function: {link['name']}")
@@ -722,6 +823,7 @@ Return ONLY valid JSON.
                         """
                         
                         # Execute the JavaScript code
+                        import execjs
                         ctx = execjs.compile(js_context)
                         result = ctx.eval("execute()")
                         
@@ -854,6 +956,8 @@ Return ONLY valid JSON.
         
         base_context = self.build_context(self.memory)
         
+        from langchain_openai import ChatOpenAI
+        
         try:
             # Get formatted prompt - allow exceptions to propagate upward
             formatted_prompt = self._get_formatted_prompt(link, base_context)
@@ -943,7 +1047,7 @@ Return ONLY valid JSON.
                     try:
                         extracted = extract_json(raw_result)
                         parsed = json.loads(extracted)
-                        validate(instance=parsed, schema=output_schema)
+                        validate_instance(instance=parsed, schema=output_schema)
                         result["data"] = parsed
                     except (json.JSONDecodeError, ValidationError) as e:
                         # Use schema processor
@@ -1003,7 +1107,7 @@ Return ONLY valid JSON.
                     try:
                         extracted = extract_json(raw_result)
                         parsed = json.loads(extracted)
-                        validate(instance=parsed, schema=output_schema)
+                        validate_instance(instance=parsed, schema=output_schema)
                         result["data"] = parsed
                     except (json.JSONDecodeError, ValidationError) as e:
                         # Use schema processor
@@ -1088,6 +1192,7 @@ Return ONLY valid JSON.
         
         try:
             # Use a more constrained model for structured data extraction
+            from langchain_openai import ChatOpenAI
             llm = ChatOpenAI(model_name="gpt-4o", temperature=0.0)
             response = llm.invoke(conversion_prompt)
             structured_text = response.content
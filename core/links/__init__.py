@@ -5,12 +5,48 @@ from typing import Dict, Any, Type, Optional, List
 import logging
 import importlib
 import os
+import re
 
 logger = logging.getLogger(__name__)
 
+# Core link modules live alongside this file; domain links under core/domains
+_LINKS_DIR = os.path.dirname(os.path.abspath(__file__))
+_DOMAINS_DIR = os.path.join(os.path.dirname(_LINKS_DIR), "domains")
+
 # Dictionary for storing registered link handlers
 _link_handlers = {}
 
+# {{ name }} / {{ name.data.field }} placeholders, substituted in a single pass
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*([\w.]+)\s*\}\}")
+
+def substitute_placeholders(template: Any, context: Dict[str, Any]) -> Any:
+    """
+    Replace ``{{ path }}`` placeholders in a string with values from context.
+    
+    Dotted paths such as ``Link.data.field`` are walked through nested dicts.
+    Placeholders that don't resolve are left as they are, and non-string
+    templates are returned unchanged.
+    
+    Args:
+        template: The template string (or any other value)
+        context: Values to substitute
+        
+    Returns:
+        The template with its placeholders substituted
+    """
+    if not isinstance(template, str) or "{{" not in template:
+        return template
+
+    def resolve(match):
+        value = context
+        for part in match.group(1).split("."):
+            if not isinstance(value, dict) or part not in value:
+                return match.group(0)
+            value = value[part]
+        return str(value)
+
+    return _PLACEHOLDER_RE.sub(resolve, template)
+
 class LinkHandler:
     """Base class for all link handlers."""
     
@@ -49,6 +85,16 @@ def register_link_type(link_type: str, handler_class: Type[LinkHandler]) -> None
     _link_handlers[link_type] = handler_class
     logger.info(f"Registered link handler for type: {link_type}")
 
+def register_link_types(handlers: Dict[str, Type[LinkHandler]]) -> None:
+    """
+    Register several link handlers at once.
+    
+    Args:
+        handlers: Mapping of link type identifier to handler class
+    """
+    _link_handlers.update(handlers)
+    logger.info(f"Registered link handlers for types: {', '.join(handlers)}")
+
 def get_link_handler(link_type: str) -> Optional[Type[LinkHandler]]:
     """
     Get a handler for a specific link type.
@@ -74,8 +120,7 @@ def list_link_types() -> List[str]:
 def discover_links() -> None:
     """Discover and register links from core domains"""
     # Load core links first
-    current_dir = os.path.dirname(__file__)
-    for file in os.listdir(current_dir):
+    for file in os.listdir(_LINKS_DIR):
         if file.endswith('.py') and file != '__init__.py':
             module_name = file[:-3]  # Remove .py extension
             try:
@@ -85,10 +130,9 @@ def discover_links() -> None:
                 logger.error(f"Error loading core link handler module {module_name}: {e}")
     
     # Then discover domain-specific links
-    domains_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "domains")
-    if os.path.exists(domains_dir):
-        for domain_name in os.listdir(domains_dir):
-            domain_path = os.path.join(domains_dir, domain_name)
+    if os.path.exists(_DOMAINS_DIR):
+        for domain_name in os.listdir(_DOMAINS_DIR):
+            domain_path = os.path.join(_DOMAINS_DIR, domain_name)
             if os.path.isdir(domain_path) and not domain_name.startswith("__"):
                 links_file = os.path.join(domain_path, "links.py")
                 if os.path.exists(links_file):
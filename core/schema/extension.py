@@ -4,7 +4,8 @@ Schema extension utilities for enhancing recipes with models
 import json
 import logging
 from typing import Dict, Any, Optional, List, Union
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from core.schemas import validate_instance
 
 logger = logging.getLogger(__name__)
 
@@ -144,7 +145,7 @@ def register_schema_processor(executor):
         if "_validation_schema" in processed_config and result:
             try:
                 data = result.get("data", {})
-                validate(instance=data, schema=processed_config["_validation_schema"])
+                validate_instance(instance=data, schema=processed_config["_validation_schema"])
             except ValidationError as e:
                 logger.warning(f"Output validation failed: {e}")
                 
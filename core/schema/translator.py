@@ -5,7 +5,8 @@ import json
 import logging
 from typing import Dict, Any, Optional, List, Union
 from langchain_openai import ChatOpenAI
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from core.schemas import validate_instance
 from core.security.credentials import get_credential
 
 logger = logging.getLogger(__name__)
@@ -22,7 +23,7 @@ def is_valid_for_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> bool:
         True if valid, False otherwise
     """
     try:
-        validate(instance=data, schema=schema)
+        validate_instance(instance=data, schema=schema)
         return True
     except ValidationError:
         return False
@@ -101,7 +102,7 @@ def retry_adaptation(original_data: Dict[str, Any],
     # Find validation errors in first attempt
     errors = []
     try:
-        validate(instance=first_attempt, schema=target_schema)
+        validate_instance(instance=first_attempt, schema=target_schema)
     except ValidationError as e:
         errors = [err.message for err in e.context]
     
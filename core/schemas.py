@@ -9,19 +9,34 @@ This module provides:
 Part of DOCENRICH Sprint - Schema-Driven Document Enrichment.
 See ADR-0006 for architectural context.
 """
-from typing import Dict, Any, Optional, Union
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Union
 import logging
 import json
 import os
+import threading
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 logger = logging.getLogger(__name__)
 
 # Dictionary to store registered schemas
 _schemas = {}
 
-# Cache for loaded schema files
-_schema_cache: Dict[str, Dict[str, Any]] = {}
+# Cache for loaded schema files, keyed by absolute path -> (mtime_ns, schema)
+_schema_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Compiled validators keyed by the schema's canonical JSON text, least
+# recently used first. Keying on content rather than the schema object means
+# equal schemas rebuilt as new dicts share a validator, and a schema changed
+# in place is looked up under its new content.
+_validator_cache: "OrderedDict[str, Any]" = OrderedDict()
+_validator_cache_lock = threading.Lock()
+_MAX_VALIDATORS = 256
 
 
 class SchemaError(Exception):
@@ -71,14 +86,84 @@ def list_schemas() -> Dict[str, Dict[str, Any]]:
     return _schemas
 
 
+def validate_instance(instance: Any, schema: Dict[str, Any]) -> None:
+    """
+    Validate an instance against a JSON Schema.
+    
+    Behaves like ``jsonschema.validate``, but the schema is checked and its
+    validator built only the first time a given schema is seen, so repeated
+    validation (e.g. across LLM retries) skips that work.
+    
+    Args:
+        instance: The data to validate
+        schema: JSON Schema definition
+        
+    Raises:
+        jsonschema.ValidationError: If the instance is invalid
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    from jsonschema.exceptions import best_match
+    
+    validator = _cached_validator(schema)
+    
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+def _schema_key(schema: Dict[str, Any]) -> Optional[str]:
+    """Canonical JSON text for a schema, or None if it is not JSON-serialisable."""
+    try:
+        return json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
+def _cached_validator(schema: Dict[str, Any]) -> Any:
+    """
+    Return a compiled validator for a schema, building it on a cache miss.
+    
+    Serialising the schema to find its entry costs a small fraction of
+    checking it and constructing its validator. The validator is built from
+    a copy parsed back from that text, so later changes to the caller's dict
+    can't alter a cached validator. Schemas that aren't JSON-serialisable
+    are validated without caching.
+    """
+    from jsonschema import validators
+    
+    key = _schema_key(schema)
+    if key is None:
+        validator_class = validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        return validator_class(schema)
+    
+    with _validator_cache_lock:
+        validator = _validator_cache.get(key)
+        if validator is not None:
+            _validator_cache.move_to_end(key)
+            return validator
+    
+    validator_class = validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    validator = validator_class(json.loads(key))
+    
+    with _validator_cache_lock:
+        _validator_cache[key] = validator
+        while len(_validator_cache) > _MAX_VALIDATORS:
+            _validator_cache.popitem(last=False)
+    return validator
+
+
 # =============================================================================
 # Schema File Loading (DOCENRICH Sprint)
 # =============================================================================
 
 def clear_schema_cache() -> None:
-    """Clear the schema file cache. Useful for testing."""
+    """Clear the schema file and compiled validator caches. Useful for testing."""
     global _schema_cache
     _schema_cache.clear()
+    with _validator_cache_lock:
+        _validator_cache.clear()
 
 
 def _validate_schema_structure(schema: Dict[str, Any], file_path: str) -> None:
@@ -123,7 +208,8 @@ def load_schema_file(file_path: str) -> Dict[str, Any]:
     Load a JSON Schema from a file.
     
     Supports both YAML (.yaml, .yml) and JSON (.json) formats.
-    Results are cached to avoid repeated disk reads.
+    Results are cached to avoid repeated disk reads and validation; the
+    cache entry is reused only while the file's modification time is unchanged.
     
     Args:
         file_path: Absolute or relative path to the schema file
@@ -135,28 +221,30 @@ def load_schema_file(file_path: str) -> Dict[str, Any]:
         SchemaNotFoundError: If the file doesn't exist
         SchemaValidationError: If the file isn't valid JSON Schema
     """
-    # Check cache first
+    # A single stat both checks the file exists and validates the cache entry
     abs_path = os.path.abspath(file_path)
-    if abs_path in _schema_cache:
-        logger.debug(f"Schema cache hit: {abs_path}")
-        return _schema_cache[abs_path]
-    
-    # Check file exists
-    if not os.path.exists(abs_path):
+    try:
+        mtime_ns = os.stat(abs_path).st_mtime_ns
+    except OSError:
         raise SchemaNotFoundError(f"Schema file not found: {file_path}")
     
+    cached = _schema_cache.get(abs_path)
+    if cached is not None and cached[0] == mtime_ns:
+        logger.debug("Schema cache hit: %s", abs_path)
+        return cached[1]
+    
     # Load based on extension
     ext = os.path.splitext(file_path)[1].lower()
     
     try:
         with open(abs_path, 'r', encoding='utf-8') as f:
             if ext in ('.yaml', '.yml'):
-                schema = yaml.safe_load(f)
+                schema = yaml.load(f, Loader=YamlSafeLoader)
             elif ext == '.json':
                 schema = json.load(f)
             else:
                 # Default to YAML (more permissive parser)
-                schema = yaml.safe_load(f)
+                schema = yaml.load(f, Loader=YamlSafeLoader)
     except yaml.YAMLError as e:
         raise SchemaValidationError(f"Invalid YAML in schema file {file_path}: {e}")
     except json.JSONDecodeError as e:
@@ -166,7 +254,7 @@ def load_schema_file(file_path: str) -> Dict[str, Any]:
     _validate_schema_structure(schema, file_path)
     
     # Cache and return
-    _schema_cache[abs_path] = schema
+    _schema_cache[abs_path] = (mtime_ns, schema)
     logger.debug(f"Loaded and cached schema: {abs_path}")
     
     return schema
@@ -4,7 +4,6 @@ Secure credential management utilities.
 import os
 import logging
 from typing import Dict, List, Optional, Union, Any
-from dotenv import load_dotenv
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -19,6 +18,8 @@ def load_all_env_files():
     2. Core .env file
     3. Root .env file (overrides others)
     """
+    from dotenv import load_dotenv
+
     # Load domain-specific .env files
     domains_dir = Path("core/domains")
     if domains_dir.exists():
@@ -42,8 +43,10 @@ def load_all_env_files():
         logger.debug(f"Loading env file: {root_env}")
         load_dotenv(root_env, override=True)
 
-# Load all env files
-load_all_env_files()
+# Load all env files, unless the caller says the environment is already set
+# up (e.g. a subprocess that inherited it)
+if os.environ.get("HOTTOPOTETO_SKIP_DOTENV") != "1":
+    load_all_env_files()
 
 def register_domain_credentials(domain: str, credentials: List[Dict[str, Any]]) -> None:
     """
@@ -3,9 +3,12 @@
 Core utility functions for the LangChain v2 system.
 """
 import os
+import sys
 import json
 import logging
 import uuid
+import importlib
+from types import ModuleType
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Union
 
@@ -113,3 +116,22 @@ def format_timestamp(timestamp: Optional[Union[str, datetime]] = None) -> str:
             return timestamp
     
     return timestamp.isoformat()
+
+def cached_import(module_name: str, modules: Dict[str, ModuleType] = sys.modules) -> ModuleType:
+    """
+    Import a module, returning it straight from sys.modules when already loaded.
+    
+    importlib.import_module takes the import lock and resolves the dotted
+    path even for modules that are already imported.
+    
+    Args:
+        module_name: Fully qualified module name
+        modules: The module table to check first (bound once as a default)
+        
+    Returns:
+        The imported module
+    """
+    module = modules.get(module_name)
+    if module is not None:
+        return module
+    return importlib.import_module(module_name)
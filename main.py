@@ -1,247 +1,558 @@
 #!/usr/bin/env python3
 import argparse
-import json
-import yaml
+import functools
 import os
 import logging
 import sys
-import pkgutil
 import importlib
-from typing import Dict, Any, List
+from types import ModuleType
+from typing import Dict, Any, List, Optional, Tuple
 
-# Ensure core is imported to trigger registration
-import core
-from core.executor import RecipeExecutor
-from core.cli.commands.packages import packages_group, list_packages, install_package, uninstall_package, create_package
-from core.cli.commands.credentials import add_credentials_command, handle_credentials_command
+# Directory containing this script, resolved once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
 
-def main():
-    # Enable debug logs to help investigate issues
-    logging.basicConfig(level=logging.DEBUG)
-    
-    parser = argparse.ArgumentParser(description="Recipe Execution CLI")
-    subparsers = parser.add_subparsers(dest="command", required=True)
+# Directory scanned for domain packages that provide CLI commands
+_DOMAINS_PATH = os.path.join(_HERE, "domains")
+
+# File extensions recognised as recipes
+_RECIPE_EXTS = frozenset({".yaml", ".yml", ".json"})
+
+# Matches core.executor.TRACE
+_TRACE = 15
+
+# Subcommands defined by this module; anything else comes from a domain CLI
+_BUILTIN_COMMANDS = frozenset({"execute", "list", "plugins", "domains", "packages", "credentials"})
+
+# Command implementations are imported inside the branch that runs them so
+# that quick commands (and shell completion) don't pay for the executor,
+# YAML parser, or package tooling at startup.
+
+def _discover_domain_clis() -> Tuple[Tuple[str, ModuleType], ...]:
+    """
+    Get the domains that provide a CLI, rescanning only when the domains
+    directory changes.
+
+    The result is used both to register subcommands and to dispatch them.
+    It is cached by the directory's modification time, so repeated main()
+    calls reuse it while adding or removing a domain triggers a rescan.
+
+    Returns:
+        Tuple of (domain name, domain module) pairs whose module has a ``cli``
+    """
+    try:
+        mtime_ns = os.stat(_DOMAINS_PATH).st_mtime_ns
+    except OSError:
+        return ()
+    return _scan_domain_clis(mtime_ns)
+
+@functools.lru_cache(maxsize=1)
+def _scan_domain_clis(mtime_ns: int) -> Tuple[Tuple[str, ModuleType], ...]:
+    """
+    Scan the domains directory and import each domain that provides a CLI.
+
+    Call ``_scan_domain_clis.cache_clear()`` to force a rescan.
+
+    Args:
+        mtime_ns: Modification time of the domains directory (the cache key)
+
+    Returns:
+        Tuple of (domain name, domain module) pairs whose module has a ``cli``
+    """
+    from core.utils import cached_import
+
+    # A domain provides a CLI when its package directory holds a cli.py or a
+    # cli/ package, so the listing alone identifies them without pkgutil's
+    # importer machinery or importing domains that have no CLI. Private
+    # entries (which includes __pycache__) are skipped.
+    try:
+        with os.scandir(_DOMAINS_PATH) as entries:
+            domain_names = sorted(
+                entry.name for entry in entries
+                if not entry.name.startswith("_")
+                and entry.is_dir()
+                and (os.path.isfile(os.path.join(entry.path, "cli.py"))
+                     or os.path.isfile(os.path.join(entry.path, "cli", "__init__.py")))
+            )
+    except OSError:
+        return ()
+
+    domain_clis = []
+    for domain_name in domain_names:
+        module_name = f"domains.{domain_name}"
+        try:
+            # Importing the cli submodule imports the domain package too
+            cached_import(f"{module_name}.cli")
+        except ImportError as e:
+            # Domains with missing optional dependencies are skipped; any
+            # other error is a bug in the domain and is left to surface
+            logging.warning(f"Failed to load CLI commands for domain {domain_name}: {e}")
+            continue
+        domain_clis.append((domain_name, sys.modules[module_name]))
+
+    return tuple(domain_clis)
+
+def _iter_recipes(root: str):
+    """
+    Yield the paths of recipe files under a directory, recursively.
+
+    Walks the tree iteratively with os.scandir, so directory entries are
+    classified from the dirent type without an extra stat per file and deep
+    trees don't build up nested generator frames.
+
+    Args:
+        root: Directory to search
+
+    Yields:
+        Path of each .yaml, .yml or .json file
+    """
+    stack = [root]
+    push = stack.append
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    push(entry.path)
+                else:
+                    name = entry.name
+                    if name[name.rfind("."):] in _RECIPE_EXTS:
+                        yield entry.path
+
+def _write_lines(lines: List[str]) -> None:
+    """
+    Write lines to stdout in a single call.
+
+    Args:
+        lines: Lines of output, without trailing newlines
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _recipe_link_types(recipe: Dict[str, Any]) -> List[str]:
+    """
+    Get the link types used by a recipe.
+
+    Args:
+        recipe: A parsed recipe, with links given as a list or a dict
+
+    Returns:
+        The ``type`` of each link that declares one
+    """
+    links = recipe.get("links", [])
+    if isinstance(links, dict):
+        links = links.values()
+    return [link["type"] for link in links if isinstance(link, dict) and link.get("type")]
 
-    # execute command: Execute a recipe file
+def _requested_command(argv: Optional[List[str]]) -> Optional[str]:
+    """
+    Find the subcommand named on the command line without building the full parser.
+
+    Args:
+        argv: Command line arguments, or None for sys.argv[1:]
+
+    Returns:
+        The subcommand name, or None if there isn't one (e.g. for --help)
+    """
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument("-v", "--verbose", action="count", default=0)
+    pre_parser.add_argument("command", nargs="?")
+    known, _ = pre_parser.parse_known_args(argv)
+    return known.command
+
+def _cmd_execute(args: argparse.Namespace) -> None:
+    """Execute a recipe file."""
+    # The executor already logs each link at TRACE; --trace just lets it through
+    if args.trace:
+        logging.getLogger().setLevel(_TRACE)
+
+    try:
+        from core.executor import RecipeExecutor, load_recipe_file
+
+        # Load the recipe file
+        try:
+            recipe = load_recipe_file(args.recipe_file)
+        except Exception as e:
+            print(f"Failed to load recipe: {e}")
+            return
+            
+        # Load just the plugins whose link types this recipe uses
+        from plugins import load_plugins_for_link_types
+        load_plugins_for_link_types(_recipe_link_types(recipe))
+            
+        # Standard execution for recipes
+        executor = RecipeExecutor(args.recipe_file, recipe=recipe)
+        executor.execute()
+        print(f"Recipe execution completed successfully.")
+        
+    except Exception as e:
+        print(f"Error executing recipe: {e}")
+
+def _cmd_list(args: argparse.Namespace) -> None:
+    """List available recipes."""
+    recipe_dir = "templates/recipes"  # Updated path
+    if not os.path.exists(recipe_dir):
+        print(f"Recipe directory not found: {recipe_dir}")
+        return
+        
+    recipes = list(_iter_recipes(recipe_dir))
+    _write_lines([f"Found {len(recipes)} recipes:"] + [f"  {recipe}" for recipe in recipes])
+
+def _cmd_plugins_list(args: argparse.Namespace) -> None:
+    """List available plugins."""
+    from plugins import discover_plugins, get_plugin_info, load_all_plugins
+
+    load_all_plugins()
+    plugins = discover_plugins()
+    lines = [f"Found {len(plugins)} plugins:"]
+    for plugin in plugins:
+        plugin_info = get_plugin_info(plugin)
+        version = plugin_info.get("version", "unknown") if plugin_info else "unknown"
+        lines.append(f"  {plugin} (v{version})")
+    _write_lines(lines)
+
+def _cmd_plugins_info(args: argparse.Namespace) -> None:
+    """Show information about a plugin."""
+    from plugins import discover_plugins, get_plugin_info, load_plugin
+
+    if args.plugin_name in discover_plugins():
+        load_plugin(args.plugin_name)
+    plugin_info = get_plugin_info(args.plugin_name)
+    if plugin_info:
+        print(f"Plugin: {args.plugin_name}")
+        print(f"Version: {plugin_info.get('version', 'unknown')}")
+        print(f"Description: {plugin_info.get('description', 'No description')}")
+        
+        if "requirements" in plugin_info:
+            print(f"Requirements:")
+            for req in plugin_info["requirements"]:
+                print(f"  - {req}")
+        
+        print("Entry points:")
+        for entry_point_type, handlers in plugin_info.get("entry_points", {}).items():
+            print(f"  {entry_point_type}: {', '.join(handlers)}")
+        
+        if "domains" in plugin_info:
+            print("Supported domains:")
+            for domain in plugin_info["domains"]:
+                print(f"  - {domain}")
+    else:
+        print(f"Plugin '{args.plugin_name}' not found or not loaded")
+
+def _cmd_domains_list(args: argparse.Namespace) -> None:
+    """List registered domains."""
+    from core.domains import list_domains
+
+    domains = list_domains()
+    _write_lines([f"Found {len(domains)} domains:"] + [f"  {domain}" for domain in domains])
+
+def _cmd_domains_info(args: argparse.Namespace) -> None:
+    """Show information about a domain."""
+    from core.domains import get_domain_interface, get_packages_for_domain
+
+    domain_interface = get_domain_interface(args.domain_name)
+    if domain_interface:
+        lines = [
+            f"Domain: {args.domain_name}",
+            f"Version: {domain_interface.get('version', 'unknown')}",
+        ]
+        
+        schemas = domain_interface.get('schemas', [])
+        lines.append(f"Schemas ({len(schemas)}):")
+        lines.extend(f"  - {schema.get('name')}" for schema in schemas)
+            
+        functions = domain_interface.get('functions', [])
+        lines.append(f"Functions ({len(functions)}):")
+        lines.extend(f"  - {function.get('name')}" for function in functions)
+            
+        packages = get_packages_for_domain(args.domain_name)
+        lines.append(f"Supported Packages ({len(packages)}):")
+        lines.extend(f"  - {package}" for package in packages)
+        _write_lines(lines)
+    else:
+        print(f"Domain '{args.domain_name}' not found")
+
+def _cmd_domains_packages(args: argparse.Namespace) -> None:
+    """List packages supporting a domain."""
+    from core.domains import get_packages_for_domain
+
+    packages = get_packages_for_domain(args.domain_name)
+    if packages:
+        print(f"Packages supporting domain '{args.domain_name}':")
+        for package in packages:
+            print(f"  - {package}")
+    else:
+        print(f"No packages found for domain '{args.domain_name}'")
+
+def _cmd_packages_list(args: argparse.Namespace) -> None:
+    """List installed packages."""
+    from core.cli.commands.packages import list_packages
+    list_packages()
+
+def _cmd_packages_install(args: argparse.Namespace) -> None:
+    """Install a package."""
+    from core.cli.commands.packages import install_package
+    install_package(args.package_name, args.dev)
+
+def _cmd_packages_uninstall(args: argparse.Namespace) -> None:
+    """Uninstall a package."""
+    from core.cli.commands.packages import uninstall_package
+    uninstall_package(args.package_name)
+
+def _cmd_packages_create(args: argparse.Namespace) -> None:
+    """Create a new package template."""
+    from core.cli.commands.packages import create_package
+    create_package(args.name, args.domain, args.plugin)
+
+def _cmd_credentials(args: argparse.Namespace) -> None:
+    """Manage credentials."""
+    from core.cli.commands.credentials import handle_credentials_command
+    handle_credentials_command(args)
+
+def _cmd_domain(args: argparse.Namespace) -> None:
+    """Hand a domain-provided command to the domain that registered it."""
+    for domain_name, domain_module in _discover_domain_clis():
+        if hasattr(domain_module.cli, "handle_command"):
+            try:
+                # Domains return True once they've handled the command
+                if domain_module.cli.handle_command(args):
+                    return
+            except Exception as e:
+                logging.warning(f"Error in domain {domain_name} CLI handling: {e}")
+
+def _add_execute_parser(subparsers) -> None:
+    """Add the execute command: Execute a recipe file."""
     execute_parser = subparsers.add_parser("execute", help="Execute a recipe file")
     execute_parser.add_argument("--recipe_file", type=str, required=True, help="Path to the recipe YAML/JSON file")
     execute_parser.add_argument("--output_dir", type=str, help="Directory to save recipe output")
+    execute_parser.add_argument("--trace", action="store_true", help="Log each link as it is executed")
+    execute_parser.set_defaults(func=_cmd_execute)
 
-    # list command: List all available recipes
+def _add_list_parser(subparsers) -> None:
+    """Add the list command: List all available recipes."""
     list_parser = subparsers.add_parser("list", help="List available recipes")
+    list_parser.set_defaults(func=_cmd_list)
 
-    # plugins command: Manage plugins
+def _add_plugins_parser(subparsers) -> None:
+    """Add the plugins command: Manage plugins."""
     plugins_parser = subparsers.add_parser("plugins", help="Manage plugins")
     plugins_subparsers = plugins_parser.add_subparsers(dest="plugins_command", required=True)
     
     # plugins list command
     plugins_list_parser = plugins_subparsers.add_parser("list", help="List available plugins")
+    plugins_list_parser.add_argument("--refresh-plugins", action="store_true",
+                                     help="Rescan for plugins installed since the interpreter started")
+    plugins_list_parser.set_defaults(func=_cmd_plugins_list)
     
     # plugins info command
     plugins_info_parser = plugins_subparsers.add_parser("info", help="Get information about a plugin")
     plugins_info_parser.add_argument("plugin_name", help="Name of the plugin")
+    plugins_info_parser.set_defaults(func=_cmd_plugins_info)
 
-    # domains command: Manage domains
+def _add_domains_parser(subparsers) -> None:
+    """Add the domains command: Manage domains."""
     domains_parser = subparsers.add_parser("domains", help="Manage domains")
     domains_subparsers = domains_parser.add_subparsers(dest="domains_command", required=True)
     
     # domains list command
     domains_list_parser = domains_subparsers.add_parser("list", help="List available domains")
+    domains_list_parser.add_argument("--refresh-plugins", action="store_true",
+                                     help="Rescan for domains installed since the interpreter started")
+    domains_list_parser.set_defaults(func=_cmd_domains_list)
     
     # domains info command
     domains_info_parser = domains_subparsers.add_parser("info", help="Get information about a domain")
     domains_info_parser.add_argument("domain_name", help="Name of the domain")
+    domains_info_parser.set_defaults(func=_cmd_domains_info)
     
     # domains packages command
     domains_packages_parser = domains_subparsers.add_parser("packages", help="List packages supporting a domain")
     domains_packages_parser.add_argument("domain_name", help="Name of the domain")
+    domains_packages_parser.set_defaults(func=_cmd_domains_packages)
 
-    # Register package commands
-    # Create a subparser for packages commands
+def _add_packages_parser(subparsers) -> None:
+    """Add the packages command: Manage packages."""
     packages_parser = subparsers.add_parser("packages", help="Manage packages")
     packages_subparsers = packages_parser.add_subparsers(dest="packages_command", required=True)
     
     # Add package commands to the subparser
-    packages_subparsers.add_parser("list", help="List installed packages")
+    packages_list_parser = packages_subparsers.add_parser("list", help="List installed packages")
+    packages_list_parser.set_defaults(func=_cmd_packages_list)
     
     install_parser = packages_subparsers.add_parser("install", help="Install a package")
     install_parser.add_argument("package_name", help="Name of the package to install")
     install_parser.add_argument("--dev", action="store_true", help="Install in development mode")
+    install_parser.set_defaults(func=_cmd_packages_install)
     
     uninstall_parser = packages_subparsers.add_parser("uninstall", help="Uninstall a package")
     uninstall_parser.add_argument("package_name", help="Name of the package to uninstall")
+    uninstall_parser.set_defaults(func=_cmd_packages_uninstall)
     
     create_parser = packages_subparsers.add_parser("create", help="Create a new package template")
     create_parser.add_argument("name", help="Name of the package")
     create_parser.add_argument("--domain", help="Include domain template")
     create_parser.add_argument("--plugin", help="Include plugin template")
+    create_parser.set_defaults(func=_cmd_packages_create)
 
-    # Add credentials command
+def _add_credentials_parser(subparsers) -> None:
+    """Add the credentials command: Manage API keys and other credentials."""
+    from core.cli.commands.credentials import add_credentials_command
     add_credentials_command(subparsers)
+    subparsers.choices["credentials"].set_defaults(func=_cmd_credentials)
 
-    # Add domain-specific subcommands
-    try:
-        for domain_module_info in pkgutil.iter_modules([os.path.join(os.path.dirname(__file__), "domains")]):
-            domain_name = domain_module_info.name
-            if domain_name != "__pycache__" and not domain_name.startswith("_"):
-                try:
-                    domain_module = importlib.import_module(f"domains.{domain_name}")
-                    if hasattr(domain_module, "cli") and hasattr(domain_module.cli, "register_commands"):
-                        domain_module.cli.register_commands(subparsers)
-                except Exception as e:
-                    logging.warning(f"Failed to register CLI commands for domain {domain_name}: {e}")
-    except Exception as e:
-        logging.warning(f"Failed to load domain-specific CLI commands: {e}")
+# Parser builders for the built-in subcommands, in help order
+_PARSER_BUILDERS = {
+    "execute": _add_execute_parser,
+    "list": _add_list_parser,
+    "plugins": _add_plugins_parser,
+    "domains": _add_domains_parser,
+    "packages": _add_packages_parser,
+    "credentials": _add_credentials_parser,
+}
 
-    args = parser.parse_args()
+# Subcommand verbs that take no options, as (handler, positional dest).
+# These are dispatched by _verb_args without building a parser; the argparse
+# definitions above remain the reference for help and for everything else.
+_VERB_COMMANDS = {
+    ("plugins", "list"): (_cmd_plugins_list, None),
+    ("plugins", "info"): (_cmd_plugins_info, "plugin_name"),
+    ("domains", "list"): (_cmd_domains_list, None),
+    ("domains", "info"): (_cmd_domains_info, "domain_name"),
+    ("domains", "packages"): (_cmd_domains_packages, "domain_name"),
+    ("packages", "list"): (_cmd_packages_list, None),
+    ("packages", "uninstall"): (_cmd_packages_uninstall, "package_name"),
+}
 
-    if args.command == "execute":
-        try:
-            # Load the recipe file
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI argument parser.
+
+    When ``command`` is a built-in subcommand only that subcommand's parser
+    is built. Otherwise (no command, --help, or a domain command) every
+    built-in is added and domain-provided subcommands are registered.
+    Each variant is built once and reused by later main() calls, until the
+    domain scan changes for variants that include domain subcommands.
+
+    Args:
+        command: The subcommand named on the command line, if known
+
+    Returns:
+        The configured argument parser
+    """
+    # Built-in commands don't need the domain scan at all
+    domain_clis = () if command in _BUILTIN_COMMANDS else _discover_domain_clis()
+    return _build_parser_for(command, domain_clis)
+
+@functools.lru_cache(maxsize=8)
+def _build_parser_for(command: Optional[str],
+                      domain_clis: Tuple[Tuple[str, ModuleType], ...]) -> argparse.ArgumentParser:
+    """
+    Build the parser for a command and set of domain CLIs.
+
+    The domain CLIs are part of the cache key, so a rescan that finds
+    different domains builds a new parser instead of reusing one with
+    stale domain subcommands.
+
+    Args:
+        command: The subcommand named on the command line, if known
+        domain_clis: The (domain name, domain module) pairs to register
+
+    Returns:
+        The configured argument parser
+    """
+    parser = argparse.ArgumentParser(description="Recipe Execution CLI")
+    parser.add_argument("-v", "--verbose", action="count", default=0,
+                        help="Show more log output (-v for info, -vv for debug)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    if command in _BUILTIN_COMMANDS:
+        _PARSER_BUILDERS[command](subparsers)
+        return parser
+
+    for add_parser in _PARSER_BUILDERS.values():
+        add_parser(subparsers)
+
+    # Add domain-specific subcommands
+    for domain_name, domain_module in domain_clis:
+        if hasattr(domain_module.cli, "register_commands"):
             try:
-                with open(args.recipe_file, "r") as f:
-                    if args.recipe_file.endswith((".yaml", ".yml")):
-                        recipe = yaml.safe_load(f)
-                    else:
-                        recipe = json.load(f)
+                domain_module.cli.register_commands(subparsers)
             except Exception as e:
-                print(f"Failed to load recipe: {e}")
-                return
-                
-            # Standard execution for recipes
-            executor = RecipeExecutor(args.recipe_file)
-            executor.execute()
-            print(f"Recipe execution completed successfully.")
-            
-        except Exception as e:
-            print(f"Error executing recipe: {e}")
-            
-    elif args.command == "list":
-        # List available recipes
-        recipe_dir = "templates/recipes"  # Updated path
-        if not os.path.exists(recipe_dir):
-            print(f"Recipe directory not found: {recipe_dir}")
-            return
-            
-        recipes = []
-        for root, dirs, files in os.walk(recipe_dir):
-            for file in files:
-                if file.endswith((".yaml", ".yml", ".json")):
-                    recipe_path = os.path.join(root, file)
-                    recipes.append(recipe_path)
-                    
-        print(f"Found {len(recipes)} recipes:")
-        for recipe in recipes:
-            print(f"  {recipe}")
-
-    elif args.command == "plugins":
-        from plugins import discover_plugins, load_plugin, get_plugin_info
-        
-        if args.plugins_command == "list":
-            plugins = discover_plugins()
-            print(f"Found {len(plugins)} plugins:")
-            for plugin in plugins:
-                plugin_info = get_plugin_info(plugin)
-                version = plugin_info.get("version", "unknown") if plugin_info else "unknown"
-                print(f"  {plugin} (v{version})")
-                
-        elif args.plugins_command == "info":
-            plugin_info = get_plugin_info(args.plugin_name)
-            if plugin_info:
-                print(f"Plugin: {args.plugin_name}")
-                print(f"Version: {plugin_info.get('version', 'unknown')}")
-                print(f"Description: {plugin_info.get('description', 'No description')}")
-                
-                if "requirements" in plugin_info:
-                    print(f"Requirements:")
-                    for req in plugin_info["requirements"]:
-                        print(f"  - {req}")
-                
-                print("Entry points:")
-                for entry_point_type, handlers in plugin_info.get("entry_points", {}).items():
-                    print(f"  {entry_point_type}: {', '.join(handlers)}")
-                
-                if "domains" in plugin_info:
-                    print("Supported domains:")
-                    for domain in plugin_info["domains"]:
-                        print(f"  - {domain}")
-            else:
-                print(f"Plugin '{args.plugin_name}' not found or not loaded")
-    
-    elif args.command == "domains":
-        from core.domains import list_domains, get_domain_interface, get_packages_for_domain
-        
-        if args.domains_command == "list":
-            domains = list_domains()
-            print(f"Found {len(domains)} domains:")
-            for domain in domains:
-                print(f"  {domain}")
-                
-        elif args.domains_command == "info":
-            domain_interface = get_domain_interface(args.domain_name)
-            if domain_interface:
-                print(f"Domain: {args.domain_name}")
-                print(f"Version: {domain_interface.get('version', 'unknown')}")
-                
-                schemas = domain_interface.get('schemas', [])
-                print(f"Schemas ({len(schemas)}):")
-                for schema in schemas:
-                    print(f"  - {schema.get('name')}")
-                    
-                functions = domain_interface.get('functions', [])
-                print(f"Functions ({len(functions)}):")
-                for function in functions:
-                    print(f"  - {function.get('name')}")
-                    
-                packages = get_packages_for_domain(args.domain_name)
-                print(f"Supported Packages ({len(packages)}):")
-                for package in packages:
-                    print(f"  - {package}")
-            else:
-                print(f"Domain '{args.domain_name}' not found")
-        
-        elif args.domains_command == "packages":
-            packages = get_packages_for_domain(args.domain_name)
-            if packages:
-                print(f"Packages supporting domain '{args.domain_name}':")
-                for package in packages:
-                    print(f"  - {package}")
-            else:
-                print(f"No packages found for domain '{args.domain_name}'")
+                logging.warning(f"Failed to register CLI commands for domain {domain_name}: {e}")
+
+    return parser
+
+def _verb_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse an option-free ``<command> <verb> [NAME]`` invocation without argparse.
+
+    Args:
+        argv: Command line arguments
+
+    Returns:
+        The parsed arguments, or None if argparse is needed (options, help,
+        unknown verbs or the wrong number of arguments)
+    """
+    if len(argv) < 2 or any(arg.startswith("-") for arg in argv):
+        return None
+    spec = _VERB_COMMANDS.get((argv[0], argv[1]))
+    if spec is None:
+        return None
+    func, dest = spec
+    if len(argv) != (3 if dest else 2):
+        return None
+    args = argparse.Namespace(verbose=0, command=argv[0], func=func)
+    setattr(args, f"{argv[0]}_command", argv[1])
+    if dest:
+        setattr(args, dest, argv[2])
+    return args
+
+def _env_log_level() -> int:
+    """Return the log level named by HOTTOPOTETO_LOG_LEVEL, defaulting to WARNING."""
+    name = (os.environ.get("HOTTOPOTETO_LOG_LEVEL")
+            or os.environ.get("HOTTOPOTETO_LOGLEVEL", "WARNING")).upper()
+    # TRACE is registered by core.executor, which hasn't been imported yet
+    if name == "TRACE":
+        return _TRACE
+    level = logging.getLevelName(name)
+    return level if isinstance(level, int) else logging.WARNING
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Run the CLI.
+
+    Args:
+        argv: Command line arguments, defaulting to sys.argv[1:]
+    """
+    # Quiet by default; HOTTOPOTETO_LOG_LEVEL or -v/-vv turn logging up. This
+    # runs before core is imported so core's own basicConfig doesn't apply.
+    logging.basicConfig(
+        level=_env_log_level(),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     
-    # Handle credentials command
-    if args.command == "credentials":
-        handle_credentials_command(args)
-
-    # Add package command handler
-    if args.command == "packages":
-        if args.packages_command == "list":
-            list_packages()
-        elif args.packages_command == "install":
-            install_package(args.package_name, args.dev if hasattr(args, 'dev') else False)
-        elif args.packages_command == "uninstall":
-            uninstall_package(args.package_name)
-        elif args.packages_command == "create":
-            create_package(args.name, args.domain, args.plugin)
-
-    # Handle domain-specific commands
-    else:
-        try:
-            # Find the domain that registered this command
-            for domain_module_info in pkgutil.iter_modules([os.path.join(os.path.dirname(__file__), "domains")]):
-                domain_name = domain_module_info.name
-                if domain_name != "__pycache__" and not domain_name.startswith("_"):
-                    try:
-                        domain_module = importlib.import_module(f"domains.{domain_name}")
-                        if hasattr(domain_module, "cli") and hasattr(domain_module.cli, "handle_command"):
-                            # Try to handle the command with this domain
-                            domain_module.cli.handle_command(args)
-                            break
-                    except Exception as e:
-                        logging.warning(f"Error in domain {domain_name} CLI handling: {e}")
-        except Exception as e:
-            logging.error(f"Failed to handle domain-specific command: {e}")
-            print(f"Error: {e}")
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Plain "<command> <verb> [NAME]" calls skip argparse entirely. Otherwise
+    # only the requested built-in command's parser is built; domain
+    # subcommands are only scanned for when the command isn't built in
+    args = _verb_args(argv)
+    if args is None:
+        args = _build_parser(_requested_command(argv)).parse_args(argv)
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG if args.verbose > 1 else logging.INFO)
+
+    # Import finder caches are only invalidated on request so that normal
+    # runs keep them warm
+    if getattr(args, "refresh_plugins", False):
+        importlib.invalidate_caches()
+        if "plugins" in sys.modules:
+            sys.modules["plugins"].discover_plugins.cache_clear()
+        _scan_domain_clis.cache_clear()
+
+    # Built-in commands bind their handler; domain commands may not
+    handler = getattr(args, "func", None) or _cmd_domain
+    handler(args)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -3,33 +3,67 @@ Plugin discovery and loading system.
 """
 import os
 import json
-import importlib
+import functools
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
+from core.utils import cached_import
 
 logger = logging.getLogger(__name__)
 
+# Directory holding the plugin packages
+_PLUGINS_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Registry of loaded plugins
 _loaded_plugins = {}
 
+# Manifest keys kept for loaded plugins; anything else is dropped
+_MANIFEST_KEYS = ("name", "version", "description", "requirements", "entry_points", "domains")
+
+def _read_manifest(manifest_path: str) -> Dict[str, Any]:
+    """
+    Read a plugin manifest, keeping only the keys the plugin system uses.
+    
+    Uses orjson when it is installed.
+    
+    Args:
+        manifest_path: Path to the plugin's manifest.json
+        
+    Returns:
+        The manifest restricted to _MANIFEST_KEYS
+        
+    Raises:
+        FileNotFoundError: If the manifest doesn't exist
+    """
+    try:
+        import orjson
+    except ImportError:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    else:
+        with open(manifest_path, "rb") as f:
+            manifest = orjson.loads(f.read())
+    return {key: manifest[key] for key in _MANIFEST_KEYS if key in manifest}
+
+@functools.lru_cache(maxsize=1)
 def discover_plugins() -> List[str]:
     """
     Discover available plugins in the plugins directory.
     
+    The scan runs once per process; call ``discover_plugins.cache_clear()``
+    to pick up plugins added afterwards.
+    
     Returns:
         List of plugin names
     """
-    plugins_dir = os.path.dirname(os.path.abspath(__file__))
-    plugins = []
-    
-    for item in os.listdir(plugins_dir):
-        plugin_path = os.path.join(plugins_dir, item)
-        if os.path.isdir(plugin_path) and not item.startswith("__"):
-            manifest_path = os.path.join(plugin_path, "manifest.json")
-            if os.path.exists(manifest_path):
-                plugins.append(item)
-    
-    return plugins
+    # DirEntry.is_dir() uses the type from the directory listing, so only the
+    # manifest check needs a stat
+    with os.scandir(_PLUGINS_DIR) as entries:
+        return [
+            entry.name for entry in entries
+            if not entry.name.startswith("__")
+            and entry.is_dir(follow_symlinks=False)
+            and os.path.exists(os.path.join(entry.path, "manifest.json"))
+        ]
 
 def load_plugin(plugin_name: str) -> Optional[Dict[str, Any]]:
     """
@@ -44,21 +78,18 @@ def load_plugin(plugin_name: str) -> Optional[Dict[str, Any]]:
     if plugin_name in _loaded_plugins:
         return _loaded_plugins[plugin_name]
         
-    plugins_dir = os.path.dirname(os.path.abspath(__file__))
-    plugin_path = os.path.join(plugins_dir, plugin_name)
-    manifest_path = os.path.join(plugin_path, "manifest.json")
+    manifest_path = os.path.join(_PLUGINS_DIR, plugin_name, "manifest.json")
     
-    if not os.path.exists(manifest_path):
-        logger.error(f"Plugin '{plugin_name}' does not have a manifest.json file")
-        return None
-        
     try:
         # Load the manifest
-        with open(manifest_path, "r") as f:
-            manifest = json.load(f)
+        try:
+            manifest = _read_manifest(manifest_path)
+        except FileNotFoundError:
+            logger.error(f"Plugin '{plugin_name}' does not have a manifest.json file")
+            return None
             
         # Import the plugin module
-        plugin_module = importlib.import_module(f"plugins.{plugin_name}")
+        plugin_module = cached_import(f"plugins.{plugin_name}")
         
         # Register the plugin
         _loaded_plugins[plugin_name] = manifest
@@ -69,7 +100,7 @@ def load_plugin(plugin_name: str) -> Optional[Dict[str, Any]]:
             if "link_handlers" in manifest["entry_points"]:
                 for handler_file in manifest["entry_points"]["link_handlers"]:
                     try:
-                        importlib.import_module(f"plugins.{plugin_name}.{handler_file.replace('.py', '')}")
+                        cached_import(f"plugins.{plugin_name}.{handler_file.replace('.py', '')}")
                     except ImportError as e:
                         logger.error(f"Failed to load link handler {handler_file} for plugin {plugin_name}: {e}")
         
@@ -90,6 +121,23 @@ def load_all_plugins() -> Dict[str, Dict[str, Any]]:
         load_plugin(plugin_name)
     return _loaded_plugins
 
+def load_plugins_for_link_types(link_types: Iterable[str]) -> None:
+    """
+    Load only the plugins that provide the given link types.
+    
+    A link type belongs to the plugin named by its first dotted segment,
+    e.g. ``gemini`` for the ``gemini`` link type. Link types that don't
+    match a plugin (such as core domain links) are ignored.
+    
+    Args:
+        link_types: Link types used by a recipe
+    """
+    available = set(discover_plugins())
+    for link_type in link_types:
+        plugin_name = link_type.split(".", 1)[0]
+        if plugin_name in available:
+            load_plugin(plugin_name)
+
 def get_plugin_info(plugin_name: str) -> Optional[Dict[str, Any]]:
     """
     Get information about a loaded plugin.
@@ -101,6 +149,3 @@ def get_plugin_info(plugin_name: str) -> Optional[Dict[str, Any]]:
         Plugin manifest data if loaded, None otherwise
     """
     return _loaded_plugins.get(plugin_name)
-
-# Load all plugins when this module is loaded
-load_all_plugins()
@@ -1,13 +1,18 @@
 """
 Functions for linguistics domain
 """
+import functools
 import logging
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, List, Pattern, Tuple
 from core.registration import register_domain_function
 from .models import Word, Phoneme, MorphologicalRule
 
 logger = logging.getLogger(__name__)
 
+# Runs of consecutive vowels; each run counts as one syllable
+_VOWEL_RUN_RE = re.compile(r"[aeiouAEIOU]+")
+
 def analyze_word(word: str, language: str) -> Dict[str, Any]:
     """
     Analyze a word's linguistic properties
@@ -37,24 +42,70 @@ def estimate_syllables(word: str) -> int:
         Estimated syllable count
     """
     # Very basic syllable counting (not linguistically accurate)
-    vowels = "aeiouAEIOU"
-    count = 0
-    prev_was_vowel = False
-    
-    for char in word:
-        if char in vowels:
-            if not prev_was_vowel:
-                count += 1
-            prev_was_vowel = True
-        else:
-            prev_was_vowel = False
+    count = len(_VOWEL_RUN_RE.findall(word))
             
     return max(count, 1)  # At least one syllable
 
+def _trie_regex(node: Dict[str, Any]) -> str:
+    """
+    Turn a character trie into a regex that matches the longest symbol.
+    
+    Each node becomes an alternation of its children, made optional when a
+    symbol also ends there. Greedy optionals try the longer symbol first and
+    back off to the shorter one, so shared prefixes are only matched once.
+    
+    Args:
+        node: Trie node mapping characters to child nodes; the "" key marks
+            the end of a symbol
+        
+    Returns:
+        Regex source for the symbols below this node
+    """
+    branches = [re.escape(ch) + _trie_regex(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    if len(branches) == 1:
+        body = branches[0]
+    elif all(len(branch) == 1 for branch in branches):
+        # Plain single characters collapse into a character class
+        body = "[" + "".join(branches) + "]"
+    else:
+        body = "(?:" + "|".join(branches) + ")"
+    if "" not in node:
+        return body
+    if len(body) == 1 or body[0] == "[":
+        return body + "?"
+    return "(?:" + body + ")?"
+
+@functools.lru_cache(maxsize=32)
+def _phoneme_pattern(symbols: Tuple[str, ...]) -> Pattern[str]:
+    """
+    Compile a regex matching the longest of the given phoneme symbols.
+    
+    The symbols are built into a character trie first so that symbols
+    sharing a prefix (e.g. "t", "th", "ts") share one branch of the regex.
+    
+    Args:
+        symbols: Phoneme symbols of an inventory
+        
+    Returns:
+        Compiled regex for the symbols
+    """
+    root: Dict[str, Any] = {}
+    for symbol in symbols:
+        node = root
+        for ch in symbol:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    return re.compile(_trie_regex(root))
+
 def parse_phonemes(text: str, phoneme_inventory: List[Dict[str, Any]]) -> List[str]:
     """
     Parse text into constituent phonemes
     
+    At each position the longest matching symbol is taken; characters that
+    don't start any symbol are skipped.
+    
     Args:
         text: Text to analyze
         phoneme_inventory: List of phonemes in the language
@@ -62,28 +113,13 @@ def parse_phonemes(text: str, phoneme_inventory: List[Dict[str, Any]]) -> List[s
     Returns:
         List of phoneme symbols found in the text
     """
-    # Example implementation
-    result = []
-    
-    # Sort phonemes by length (longest first) to avoid partial matches
-    sorted_phonemes = sorted(phoneme_inventory, key=lambda p: len(p["symbol"]), reverse=True)
+    symbols = tuple(p["symbol"] for p in phoneme_inventory if p["symbol"])
+    if not symbols:
+        return []
     
-    i = 0
-    while i < len(text):
-        matched = False
-        for phoneme in sorted_phonemes:
-            symbol = phoneme["symbol"]
-            if text[i:i+len(symbol)] == symbol:
-                result.append(symbol)
-                i += len(symbol)
-                matched = True
-                break
-        
-        if not matched:
-            # Skip unknown character
-            i += 1
-            
-    return result
+    # The regex engine scans the text in C: findall tries the trie regex at
+    # each position and moves on by one character when nothing matches
+    return _phoneme_pattern(symbols).findall(text)
 
 # Register domain functions
 register_domain_function("linguistics", "analyze_word", analyze_word)
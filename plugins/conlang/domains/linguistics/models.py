@@ -458,18 +458,31 @@ register_domain_schema("linguistics", "phonological_rule", {
 })
 
 # Optional: Load additional schemas from JSON files
+_SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schemas")
+
 def load_schema_files():
     """Load and register schemas from JSON files"""
-    schema_dir = os.path.join(os.path.dirname(__file__), "schemas")
-    if os.path.exists(schema_dir):
-        for filename in os.listdir(schema_dir):
-            if filename.endswith(".json"):
-                schema_name = os.path.splitext(filename)[0]
-                schema_path = os.path.join(schema_dir, filename)
-
-                with open(schema_path, "r") as f:
+    # A missing directory is the common case; scandir reports it without a
+    # separate exists() check
+    try:
+        entries = list(os.scandir(_SCHEMA_DIR))
+    except FileNotFoundError:
+        return
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    for entry in entries:
+        if entry.name.endswith(".json") and entry.is_file():
+            schema_name = os.path.splitext(entry.name)[0]
+
+            if orjson is not None:
+                with open(entry.path, "rb") as f:
+                    schema = orjson.loads(f.read())
+            else:
+                with open(entry.path, "r", encoding="utf-8") as f:
                     schema = json.load(f)
-                    register_domain_schema("linguistics", schema_name, schema)
+            register_domain_schema("linguistics", schema_name, schema)
 
 # Load any additional schema files
 load_schema_files()
@@ -1,45 +1,57 @@
 """Gemini LLM link type implementation."""
 from typing import Dict, Any, List, Optional
+import asyncio
+import functools
 import json
 import os
+import re
 import logging
 import google.generativeai as genai
 from jinja2 import Environment, BaseLoader, StrictUndefined
 
 from core.links import LinkHandler, register_link_type
 
+# ```json fenced code blocks in model output
+_FENCE_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Validity probes only need to know whether text parses; orjson answers that
+# faster when it is installed. Its errors subclass ValueError.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Simple JSON extraction functionality
 def extract_json(text: str) -> str:
     """Extract valid JSON from text using simple extraction."""
-    import re
-    import json
-    
     # Try direct parsing first
     try:
-        json.loads(text)
+        _json_loads(text)
         return text
-    except:
+    except ValueError:
         pass
     
     # Try to extract from code blocks
-    code_block_pattern = r"\`\`\`json(.*?)\`\`\`"
-    match = re.search(code_block_pattern, text, re.DOTALL)
+    match = _FENCE_RE.search(text)
     if match:
         try:
-            json.loads(match.group(1))
+            _json_loads(match.group(1))
             return match.group(1)
-        except:
+        except ValueError:
             pass
     
-    # Try to extract from any JSON-like structure
-    json_pattern = r"\{.*?\}"
-    match = re.search(json_pattern, text, re.DOTALL)
-    if match:
+    # Try to extract the first complete JSON object. raw_decode parses from
+    # each "{" and stops where the object ends, so nested objects come back
+    # whole and no backtracking regex is involved.
+    start = text.find("{")
+    while start != -1:
         try:
-            json.loads(match.group(0))
-            return match.group(0)
-        except:
-            pass
+            _, end = _JSON_DECODER.raw_decode(text, start)
+            return text[start:end]
+        except ValueError:
+            start = text.find("{", start + 1)
     
     return ""
 
@@ -47,15 +59,37 @@ class GeminiLinkHandler(LinkHandler):
     """Handler for Gemini LLM link type."""
     
     def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
         self.api_key = config.get("api_key")
         self.model = config.get("model", "default-model")
         self.environment = Environment(loader=BaseLoader(), undefined=StrictUndefined)
+        # from_string compiles on every call; keep compiled prompts per source
+        self._compile = functools.lru_cache(maxsize=256)(self.environment.from_string)
+        # Model output varies between calls, so reusing it for a repeated
+        # prompt is opt-in. The cache is per handler, so it is per model too.
+        self._generate = self._generate_uncached
+        if config.get("cache_responses", False):
+            self._generate = functools.lru_cache(maxsize=256)(self._generate_uncached)
     
-    def handle_link(self, link: str, context: Optional[Dict[str, Any]] = None) -> str:
-        """Handle the link and return the processed result."""
-        prompt = self.environment.from_string(link).render(context or {})
+    def _generate_uncached(self, prompt: str) -> str:
+        """Send a prompt to the model and extract JSON from the response."""
+        # The key goes with each request: genai.configure is process-wide,
+        # so handlers with different keys would overwrite each other
         response = genai.generate(prompt, api_key=self.api_key, model=self.model)
         return extract_json(response)
+    
+    def handle_link(self, link: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """Handle the link and return the processed result."""
+        prompt = self._compile(link).render(context or {})
+        return self._generate(prompt)
+    
+    async def handle_link_async(self, link: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Handle the link without blocking the event loop on the API call, so
+        several independent prompts can be awaited together with asyncio.gather.
+        
+        The response cache is not consulted here.
+        """
+        prompt = self._compile(link).render(context or {})
+        return await asyncio.to_thread(self._generate_uncached, prompt)
 
 register_link_type("gemini", GeminiLinkHandler)
\ No newline at end of file
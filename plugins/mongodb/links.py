@@ -1,8 +1,32 @@
 """MongoDB link type implementation."""
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
+import contextlib
+import threading
 from pymongo import MongoClient
 
-from core.links import LinkHandler, register_link_type
+from core.links import LinkHandler, register_link_type, substitute_placeholders
+
+# One client per URI. MongoClient is thread-safe and keeps its own connection
+# pool, so it is reused across links rather than reconnecting each time.
+_clients: Dict[str, MongoClient] = {}
+_clients_lock = threading.Lock()
+
+def _get_client(uri: str) -> MongoClient:
+    """Get the shared client for a connection URI, creating it on first use."""
+    client = _clients.get(uri)
+    if client is None:
+        # Checked again under the lock so concurrent links don't each start
+        # a client (and its monitoring threads) for the same URI
+        with _clients_lock:
+            client = _clients.get(uri)
+            if client is None:
+                client = _clients[uri] = MongoClient(uri)
+    return client
+
+def _iter_documents(cursor) -> Iterator[Dict[str, Any]]:
+    """Yield documents from a cursor, closing it once consumed or discarded."""
+    with contextlib.closing(cursor):
+        yield from cursor
 
 class MongoDBLinkHandler(LinkHandler):
     """Handler for mongodb link type."""
@@ -16,7 +40,7 @@ class MongoDBLinkHandler(LinkHandler):
         collection = link_config.get("collection")
         
         # Connect to MongoDB
-        client = MongoClient(uri)
+        client = _get_client(uri)
         db = client[database]
         coll = db[collection]
         
@@ -30,10 +54,29 @@ class MongoDBLinkHandler(LinkHandler):
         # Execute operation
         result = None
         if operation == "insert":
-            result = {"inserted_id": str(coll.insert_one(inputs).inserted_id)}
+            documents = inputs.get("documents")
+            if isinstance(documents, list):
+                # A batch goes to the server in one round trip
+                inserted = coll.insert_many(documents, ordered=False)
+                result = {"inserted_ids": [str(i) for i in inserted.inserted_ids]}
+            else:
+                result = {"inserted_id": str(coll.insert_one(inputs).inserted_id)}
         elif operation == "find":
-            cursor = coll.find(inputs)
-            result = {"documents": list(cursor)}
+            # Projection, sort and limit are applied by the server so only
+            # the documents and fields needed are transferred
+            cursor = coll.find(inputs, link_config.get("projection"))
+            if link_config.get("sort"):
+                cursor = cursor.sort([tuple(key) for key in link_config["sort"]])
+            if link_config.get("limit"):
+                cursor = cursor.limit(link_config["limit"])
+            if link_config.get("batch_size"):
+                cursor = cursor.batch_size(link_config["batch_size"])
+            if link_config.get("stream", False):
+                # Documents are fetched a batch at a time as they're iterated;
+                # the output can only be consumed once
+                result = {"documents": _iter_documents(cursor)}
+            else:
+                result = {"documents": list(cursor)}
         elif operation == "update":
             filter_query = inputs.get("filter", {})
             update_dict = inputs.get("update", {})
@@ -70,6 +113,29 @@ class MongoDBLinkHandler(LinkHandler):
                 "inputs": {
                     "type": "object",
                     "description": "Operation-specific parameters"
+                },
+                "projection": {
+                    "type": "object",
+                    "description": "Fields to return for find"
+                },
+                "sort": {
+                    "type": "array",
+                    "items": {"type": "array", "items": [{"type": "string"}, {"type": "integer"}]},
+                    "description": "[field, direction] pairs to sort find results by"
+                },
+                "limit": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "Maximum number of documents for find"
+                },
+                "batch_size": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "Documents fetched per round trip for find"
+                },
+                "stream": {
+                    "type": "boolean",
+                    "description": "Return find results as a one-shot iterator instead of a list"
                 }
             }
         }
@@ -77,11 +143,7 @@ class MongoDBLinkHandler(LinkHandler):
     @classmethod
     def _process_template(cls, template, context):
         """Process a template string with values from context."""
-        # Simplified implementation - would use a proper template engine
-        if isinstance(template, str) and "{{" in template and "}}" in template:
-            for key, value in context.items():
-                template = template.replace(f"{{{{ {key} }}}}", str(value))
-        return template
+        return substitute_placeholders(template, context)
 
 # Register the MongoDB link type
 register_link_type("mongodb", MongoDBLinkHandler)
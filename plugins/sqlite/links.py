@@ -1,8 +1,34 @@
 """SQLite link type implementation."""
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+import functools
 import sqlite3
 import os
-from core.links import LinkHandler, register_link_type
+import re
+import logging
+from urllib.request import pathname2url
+from core.links import LinkHandler, register_link_type, substitute_placeholders
+
+logger = logging.getLogger(__name__)
+
+# Leading keyword of statements that never write, skipping comments and whitespace.
+# WITH and PRAGMA are deliberately excluded since both can modify the database.
+_READ_QUERY_RE = re.compile(
+    r"^\s*(?:/\*.*?\*/\s*|--[^\n]*(?:\n|$)\s*)*(SELECT|EXPLAIN|VALUES)\b",
+    re.IGNORECASE | re.DOTALL
+)
+
+def is_read_query(sql: str) -> bool:
+    """Return True if the SQL statement is known to be read-only."""
+    return bool(_READ_QUERY_RE.match(sql))
+
+@functools.lru_cache(maxsize=1024)
+def _insert_sql(table_name: str, columns: Tuple[str, ...], named: bool = False) -> str:
+    """Build (once per table and column list) the INSERT statement for a row."""
+    if named:
+        placeholders = ", ".join(f":{column}" for column in columns)
+    else:
+        placeholders = ", ".join("?" * len(columns))
+    return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
 
 class SQLiteHandler(LinkHandler):
     """Handler for sqlite link type."""
@@ -18,12 +44,21 @@ class SQLiteHandler(LinkHandler):
         for key, value_template in link_config.get("inputs", {}).items():
             inputs[key] = cls._process_template(value_template, context)
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # Classify before connecting so plain reads can use a read-only connection
+        read_only = (
+            operation == "query"
+            and isinstance(inputs.get("sql"), str)
+            and is_read_query(inputs["sql"])
+            and os.path.exists(db_path)
+        )
         
         # Connect to database
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        if read_only:
+            conn = sqlite3.connect(f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro", uri=True)
+        else:
+            # Ensure directory exists
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
         
         result = {}
@@ -45,14 +80,18 @@ class SQLiteHandler(LinkHandler):
                 data = inputs.get("data", {})
                 if not table_name or not data:
                     raise ValueError("Table name and data required for insert")
-                    
-                columns = ", ".join(data.keys())
-                placeholders = ", ".join(["?" for _ in data.keys()])
-                values = list(data.values())
                 
-                sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-                cursor.execute(sql, values)
-                result = {"inserted_id": cursor.lastrowid}
+                if isinstance(data, list):
+                    # Many rows: one statement run by executemany inside the
+                    # single transaction committed below. Named parameters
+                    # let each row's keys be in any order.
+                    sql = _insert_sql(table_name, tuple(data[0]), named=True)
+                    cursor.executemany(sql, data)
+                    result = {"inserted_count": len(data)}
+                else:
+                    sql = _insert_sql(table_name, tuple(data))
+                    cursor.execute(sql, tuple(data.values()))
+                    result = {"inserted_id": cursor.lastrowid}
                 
             elif operation == "query":
                 sql = inputs.get("sql")
@@ -61,8 +100,13 @@ class SQLiteHandler(LinkHandler):
                     raise ValueError("SQL required for query")
                     
                 cursor.execute(sql, params)
-                rows = cursor.fetchall()
-                result = {"rows": [dict(row) for row in rows]}
+                # Plain tuples zipped with one precomputed column tuple are cheaper than sqlite3.Row
+                columns = tuple(col[0] for col in cursor.description or ())
+                if link_config.get("row_format") == "columns":
+                    # Column names once plus the raw row tuples; no per-row dicts
+                    result = {"columns": list(columns), "data": cursor.fetchall()}
+                else:
+                    result = {"rows": [dict(zip(columns, row)) for row in cursor.fetchall()]}
                 
             elif operation == "update":
                 sql = inputs.get("sql")
@@ -82,12 +126,19 @@ class SQLiteHandler(LinkHandler):
                 cursor.execute(sql, params)
                 result = {"deleted_count": cursor.rowcount}
             
-            # Commit changes
-            conn.commit()
+            # Commit changes (nothing to commit for read-only queries)
+            if not read_only:
+                conn.commit()
             
-        except Exception as e:
+        except (sqlite3.Error, ValueError) as e:
+            # Database and configuration errors are reported in the result;
+            # anything else is a bug and propagates after the rollback
+            logger.error("SQLite %s error: %s", operation, e)
             conn.rollback()
             result = {"error": str(e)}
+        except Exception:
+            conn.rollback()
+            raise
             
         finally:
             conn.close()
@@ -113,6 +164,11 @@ class SQLiteHandler(LinkHandler):
                 "inputs": {
                     "type": "object",
                     "description": "Operation-specific parameters"
+                },
+                "row_format": {
+                    "type": "string",
+                    "enum": ["rows", "columns"],
+                    "description": "Query results as a list of row dicts (default) or as column names plus row tuples"
                 }
             }
         }
@@ -120,17 +176,7 @@ class SQLiteHandler(LinkHandler):
     @classmethod
     def _process_template(cls, template, context):
         """Process a template string with values from context."""
-        if isinstance(template, str) and "{{" in template and "}}" in template:
-            for key, value in context.items():
-                if key in context and isinstance(context[key], dict) and "data" in context[key]:
-                    # Handle nested data references
-                    for subkey, subvalue in context[key]["data"].items():
-                        template = template.replace(
-                            f"{{{{ {key}.data.{subkey} }}}}", 
-                            str(subvalue)
-                        )
-                template = template.replace(f"{{{{ {key} }}}}", str(value))
-        return template
+        return substitute_placeholders(template, context)
 
 # Register the SQLite link type
 register_link_type("sqlite", SQLiteHandler)
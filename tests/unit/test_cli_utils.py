@@ -0,0 +1,68 @@
+"""Tests for core.cli.utils output helpers."""
+import json
+from datetime import datetime
+from core.cli.utils import format_output, format_output_for_display
+
+
+class TestFormatOutput:
+    """Tests for format_output."""
+
+    def test_compact_when_not_a_tty(self, capsys):
+        """Test that piped output is compact JSON."""
+        format_output({"a": 1, "b": [1, 2]})
+
+        assert capsys.readouterr().out == '{"a":1,"b":[1,2]}\n'
+
+    def test_pretty_when_tty(self, capsys, monkeypatch):
+        """Test that terminal output is indented."""
+        monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+        format_output({"a": 1})
+
+        assert capsys.readouterr().out == '{\n  "a": 1\n}\n'
+
+    def test_non_serializable_values_use_str(self, capsys):
+        """Test that values json can't encode are stringified."""
+        when = datetime(2024, 1, 2, 3, 4, 5)
+        format_output({"when": when})
+
+        assert json.loads(capsys.readouterr().out) == {"when": str(when)}
+
+    def test_non_string_keys_and_big_ints(self, capsys):
+        """Test values orjson rejects by default still print like json.dumps."""
+        format_output({1: 2 ** 70})
+
+        assert json.loads(capsys.readouterr().out) == {"1": 2 ** 70}
+
+
+class TestFormatOutputForDisplay:
+    """Tests for format_output_for_display."""
+
+    def test_success_returns_data(self):
+        """Test that successful results are unwrapped to their data."""
+        assert format_output_for_display({"success": True, "data": [1, 2]}) == [1, 2]
+
+    def test_failure_returns_error_message(self):
+        """Test that failed results become an error string."""
+        result = format_output_for_display({"success": False, "error": "boom"})
+        assert result == "ERROR: boom"
+
+    def test_failure_without_error_message(self):
+        """Test the fallback error message."""
+        assert format_output_for_display({"success": False}) == "ERROR: Unknown error"
+
+    def test_success_without_data_returns_whole_result(self):
+        """Test that success results without a data key are shown as-is."""
+        result = {"success": True, "results": [], "count": 0}
+        assert format_output_for_display(result) is result
+
+    def test_non_standard_values_pass_through(self):
+        """Test that other values are returned unchanged."""
+        plain = {"a": 1}
+        assert format_output_for_display(plain) is plain
+        assert format_output_for_display("text") == "text"
+
+    def test_format_output_unwraps_standard_results(self, capsys):
+        """Test that format_output prints the unwrapped data."""
+        format_output({"success": True, "data": {"a": 1}})
+
+        assert capsys.readouterr().out == '{"a":1}\n'
@@ -12,7 +12,8 @@ from core.executor import (
     RecipeExecutor,
     FunctionRegistry,
     extract_json,
-    attempt_fix_truncated_json
+    attempt_fix_truncated_json,
+    load_recipe_file
 )
 
 
@@ -194,7 +195,13 @@ class TestExtractJsonSimple:
         text = 'Some text {"data": "value"} more text'
         result = extract_json(text)
         assert "data" in result
-    
+
+    def test_extract_nested_json_object_with_text_around(self):
+        """Test that the whole nested object is extracted, not the first inner match."""
+        text = 'Result: {"outer": {"inner": [1, {"x": 2}]}, "ok": true} -- done {"other": 1}'
+        result = extract_json(text)
+        assert json.loads(result) == {"outer": {"inner": [1, {"x": 2}]}, "ok": True}
+
     def test_extract_returns_original_if_no_json(self):
         """Test that non-JSON text is returned as-is."""
         text = "This is plain text with no JSON"
@@ -292,6 +299,40 @@ class TestRecipeExecutorInit:
         assert hasattr(executor, "function_registry")
         assert "random_number" in executor.function_registry
 
+    def test_init_uses_preparsed_recipe(self, tmp_path):
+        """Test that a recipe passed in is used without reading the file."""
+        recipe_data = {"domain": "storage", "links": []}
+
+        executor = RecipeExecutor(str(tmp_path / "not_written.yaml"), recipe=recipe_data)
+
+        assert executor.recipe is recipe_data
+        assert executor.domain == "storage"
+
+
+class TestLoadRecipeFile:
+    """Tests for load_recipe_file."""
+
+    def test_loads_yaml(self, tmp_path):
+        """Test that YAML recipes are parsed."""
+        path = tmp_path / "recipe.yaml"
+        path.write_text("name: Test\nlinks:\n  - name: A\n")
+
+        assert load_recipe_file(str(path)) == {"name": "Test", "links": [{"name": "A"}]}
+
+    def test_loads_json(self, tmp_path):
+        """Test that JSON recipes are parsed."""
+        path = tmp_path / "recipe.json"
+        path.write_text('{"name": "Test", "links": []}')
+
+        assert load_recipe_file(str(path)) == {"name": "Test", "links": []}
+
+    def test_executor_reads_json_recipes(self, tmp_path):
+        """Test that the executor loads JSON recipes from disk."""
+        path = tmp_path / "recipe.json"
+        path.write_text('{"domain": "storage", "links": []}')
+
+        assert RecipeExecutor(str(path)).domain == "storage"
+
 
 class TestRecipeExecutorBuildContext:
     """Tests for build_context method."""
@@ -0,0 +1,149 @@
+"""Tests for user input handling in core.executor."""
+import io
+import pytest
+import yaml
+from unittest.mock import patch
+from core.executor import RecipeExecutor, _INPUT_VALIDATORS, _stdin_line_reader
+
+
+def _make_executor(tmp_path, answers):
+    """Create an executor whose user input is fed from a list of answers."""
+    recipe_file = tmp_path / "test.yaml"
+    recipe_file.write_text(yaml.dump({"links": []}))
+    executor = RecipeExecutor(str(recipe_file))
+
+    answers = iter(answers)
+
+    def read_line(prompt=""):
+        return next(answers)
+
+    executor._read_line = read_line
+    return executor
+
+
+class TestInputValidators:
+    """Tests for the per-type input validators."""
+
+    def test_string_accepts_anything(self):
+        """Test that strings are passed through."""
+        assert _INPUT_VALIDATORS["string"]("hello", {}) == (True, "hello")
+
+    def test_number_converts_to_float(self):
+        """Test that numbers are converted."""
+        assert _INPUT_VALIDATORS["number"]("3.5", {}) == (True, 3.5)
+
+    def test_number_rejects_text(self):
+        """Test that invalid numbers return an error message."""
+        ok, error = _INPUT_VALIDATORS["number"]("abc", {})
+        assert ok is False
+        assert "valid number" in error
+
+    @pytest.mark.parametrize("value,expected", [("yes", True), ("N", False), ("1", True), ("false", False)])
+    def test_boolean_answers(self, value, expected):
+        """Test yes/no style answers."""
+        assert _INPUT_VALIDATORS["boolean"](value, {}) == (True, expected)
+
+    def test_boolean_rejects_other(self):
+        """Test that unknown answers are rejected."""
+        ok, _ = _INPUT_VALIDATORS["boolean"]("maybe", {})
+        assert ok is False
+
+    def test_select_maps_index_to_value(self):
+        """Test that a 1-based selection returns the option value."""
+        config = {"options": [{"value": "a"}, {"value": "b"}]}
+        assert _INPUT_VALIDATORS["select"]("2", config) == (True, "b")
+
+    def test_select_rejects_out_of_range(self):
+        """Test that out of range selections are rejected."""
+        config = {"options": [{"value": "a"}]}
+        ok, error = _INPUT_VALIDATORS["select"]("5", config)
+        assert ok is False
+        assert "between 1 and 1" in error
+
+    def test_multiselect_maps_indices(self):
+        """Test that comma-separated selections return option values."""
+        config = {"options": [{"value": "a"}, {"value": "b"}, {"value": "c"}]}
+        assert _INPUT_VALIDATORS["multiselect"]("1, 3", config) == (True, ["a", "c"])
+
+
+class TestExecuteUserInputLink:
+    """Tests for _execute_user_input_link."""
+
+    def _link(self, inputs):
+        return {
+            "name": "Inputs",
+            "inputs": inputs,
+            "output_schema": {"properties": {}},
+        }
+
+    def test_collects_typed_values(self, tmp_path):
+        """Test that each input is converted by its validator."""
+        executor = _make_executor(tmp_path, ["Alice", "42", "y"])
+        link = self._link({
+            "name": {"description": "Name", "type": "string"},
+            "age": {"description": "Age", "type": "number"},
+            "ok": {"description": "OK", "type": "boolean"},
+        })
+
+        with patch("langchain_openai.ChatOpenAI", side_effect=Exception("no llm")):
+            result = executor._execute_user_input_link(link)
+
+        assert result.data == {"name": "Alice", "age": 42.0, "ok": True}
+
+    def test_reprompts_until_valid(self, tmp_path, capsys):
+        """Test that invalid answers print the error and ask again."""
+        executor = _make_executor(tmp_path, ["nope", "7"])
+        link = self._link({"count": {"description": "Count", "type": "number"}})
+
+        with patch("langchain_openai.ChatOpenAI", side_effect=Exception("no llm")):
+            result = executor._execute_user_input_link(link)
+
+        assert result.data == {"count": 7.0}
+        assert "Please enter a valid number." in capsys.readouterr().out
+
+    def test_select_renders_option_templates(self, tmp_path):
+        """Test that select option values are rendered before selection."""
+        executor = _make_executor(tmp_path, ["1"])
+        executor.memory["Previous"] = {"raw": None, "data": {"color": "red"}}
+        link = self._link({
+            "choice": {
+                "description": "Pick",
+                "type": "select",
+                "options": [{"value": "{{ Previous.data.color }}"}],
+            }
+        })
+
+        with patch("langchain_openai.ChatOpenAI", side_effect=Exception("no llm")):
+            result = executor._execute_user_input_link(link)
+
+        assert result.data == {"choice": "red"}
+
+
+class TestStdinLineReader:
+    """Tests for _stdin_line_reader with piped stdin."""
+
+    def test_reads_piped_lines_in_order(self, monkeypatch, capsys):
+        """Test that piped lines are returned one per call without prompts."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("first\r\nsecond\n"))
+        read_line = _stdin_line_reader()
+
+        assert read_line("Name: ") == "first"
+        assert read_line("Age: ") == "second"
+        assert capsys.readouterr().out == ""
+
+    def test_raises_eof_when_exhausted(self, monkeypatch):
+        """Test that running out of lines behaves like input()."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("only\n"))
+        read_line = _stdin_line_reader()
+
+        read_line()
+        with pytest.raises(EOFError):
+            read_line()
+
+    def test_uses_input_for_a_tty(self, monkeypatch):
+        """Test that interactive sessions fall back to input()."""
+        stdin = io.StringIO()
+        stdin.isatty = lambda: True
+        monkeypatch.setattr("sys.stdin", stdin)
+
+        assert _stdin_line_reader() is input
@@ -0,0 +1,89 @@
+"""Tests for the gemini plugin link handler."""
+import asyncio
+import importlib
+import sys
+import types
+import pytest
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def genai(monkeypatch):
+    """A mocked google.generativeai module behind the gemini links module."""
+    genai = MagicMock()
+    genai.generate.side_effect = lambda prompt, **kwargs: f'{{"prompt": "{prompt}"}}'
+    google = types.ModuleType("google")
+    google.generativeai = genai
+    monkeypatch.setitem(sys.modules, "google", google)
+    monkeypatch.setitem(sys.modules, "google.generativeai", genai)
+    monkeypatch.delitem(sys.modules, "plugins.gemini.links", raising=False)
+    return genai
+
+
+@pytest.fixture
+def links(genai):
+    """The gemini links module, imported against the mocked genai."""
+    return importlib.import_module("plugins.gemini.links")
+
+
+class TestGeminiLinkHandler:
+    """Tests for GeminiLinkHandler."""
+
+    def test_api_key_is_sent_with_each_request(self, genai, links):
+        """Test that each handler passes its own key instead of configuring genai globally."""
+        first = links.GeminiLinkHandler({"api_key": "key-1", "model": "m1"})
+        second = links.GeminiLinkHandler({"api_key": "key-2", "model": "m2"})
+
+        first.handle_link("a")
+        second.handle_link("b")
+        first.handle_link("c")
+
+        assert [c.kwargs for c in genai.generate.call_args_list] == [
+            {"api_key": "key-1", "model": "m1"},
+            {"api_key": "key-2", "model": "m2"},
+            {"api_key": "key-1", "model": "m1"},
+        ]
+        genai.configure.assert_not_called()
+
+    def test_prompt_is_rendered_and_json_extracted(self, genai, links):
+        """Test that the prompt template is rendered and JSON is pulled from the reply."""
+        genai.generate.side_effect = None
+        genai.generate.return_value = 'Sure: {"word": "skryv"} hope that helps'
+        handler = links.GeminiLinkHandler({"api_key": "k"})
+
+        assert handler.handle_link("Define {{ word }}", {"word": "skryv"}) == '{"word": "skryv"}'
+        assert genai.generate.call_args.args == ("Define skryv",)
+
+    def test_responses_are_not_cached_by_default(self, genai, links):
+        """Test that repeated prompts go to the model unless caching is enabled."""
+        handler = links.GeminiLinkHandler({"api_key": "k"})
+
+        handler.handle_link("same")
+        handler.handle_link("same")
+
+        assert genai.generate.call_count == 2
+
+    def test_cache_responses_reuses_replies_per_handler(self, genai, links):
+        """Test that cache_responses answers repeated prompts without calling the model."""
+        cached = links.GeminiLinkHandler({"api_key": "k", "cache_responses": True})
+        other = links.GeminiLinkHandler({"api_key": "k", "cache_responses": True})
+
+        assert cached.handle_link("same") == cached.handle_link("same") == '{"prompt": "same"}'
+        cached.handle_link("different")
+        other.handle_link("same")
+
+        assert [c.args[0] for c in genai.generate.call_args_list] == ["same", "different", "same"]
+
+    def test_handle_link_async_overlaps_prompts(self, genai, links):
+        """Test that async links render, send with the handler's key and can be gathered."""
+        handler = links.GeminiLinkHandler({"api_key": "k", "model": "m"})
+
+        async def run():
+            return await asyncio.gather(
+                handler.handle_link_async("{{ a }}", {"a": "one"}),
+                handler.handle_link_async("two"),
+            )
+
+        assert asyncio.run(run()) == ['{"prompt": "one"}', '{"prompt": "two"}']
+        assert sorted(c.args[0] for c in genai.generate.call_args_list) == ["one", "two"]
+        assert all(c.kwargs == {"api_key": "k", "model": "m"} for c in genai.generate.call_args_list)
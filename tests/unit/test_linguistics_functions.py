@@ -0,0 +1,76 @@
+"""Tests for the conlang linguistics domain functions."""
+import sys
+import pytest
+
+
+@pytest.fixture(scope="module")
+def linguistics():
+    """
+    Import the linguistics functions, registering the conlang package first.
+
+    Modules imported here are dropped again afterwards so that later tests
+    which rely on the import registering schemas still see it happen.
+    """
+    from core.registry import PackageRegistry
+    if "conlang" not in PackageRegistry._packages:
+        PackageRegistry.register_package("conlang", None)
+
+    already_loaded = set(sys.modules)
+    from plugins.conlang.domains.linguistics import functions
+    yield functions
+
+    for name in set(sys.modules) - already_loaded:
+        if name.startswith("plugins.conlang"):
+            del sys.modules[name]
+
+
+class TestEstimateSyllables:
+    """Tests for estimate_syllables."""
+
+    @pytest.mark.parametrize("word,expected", [
+        ("cat", 1),
+        ("water", 2),
+        ("beautiful", 3),
+        ("AEIOU", 1),
+        ("rhythm", 1),
+        ("", 1),
+    ])
+    def test_counts_vowel_groups(self, linguistics, word, expected):
+        """Test that each run of vowels counts once, with a minimum of one."""
+        assert linguistics.estimate_syllables(word) == expected
+
+
+class TestParsePhonemes:
+    """Tests for parse_phonemes."""
+
+    INVENTORY = [{"symbol": "t"}, {"symbol": "th"}, {"symbol": "a"}, {"symbol": "sh"}]
+
+    def test_prefers_longest_symbol(self, linguistics):
+        """Test that multi-character phonemes win over their prefixes."""
+        assert linguistics.parse_phonemes("thata", self.INVENTORY) == ["th", "a", "t", "a"]
+
+    def test_skips_unknown_characters(self, linguistics):
+        """Test that characters outside the inventory are skipped."""
+        assert linguistics.parse_phonemes("xshax", self.INVENTORY) == ["sh", "a"]
+
+    def test_empty_inventory(self, linguistics):
+        """Test that nothing is found without an inventory."""
+        assert linguistics.parse_phonemes("abc", []) == []
+
+    def test_symbols_are_matched_literally(self, linguistics):
+        """Test that symbols containing regex metacharacters are literal."""
+        inventory = [{"symbol": "a."}, {"symbol": "b"}]
+
+        assert linguistics.parse_phonemes("a.bab", inventory) == ["a.", "b", "b"]
+
+    def test_backs_off_to_shorter_symbol(self, linguistics):
+        """Test that a partial match of a long symbol falls back to its prefix."""
+        inventory = [{"symbol": "t"}, {"symbol": "tsh"}, {"symbol": "ts"}, {"symbol": "a"}]
+
+        assert linguistics.parse_phonemes("tshatsat", inventory) == ["tsh", "a", "ts", "a", "t"]
+
+    def test_shared_prefix_without_shorter_symbol(self, linguistics):
+        """Test that a prefix that isn't itself a symbol is not matched."""
+        inventory = [{"symbol": "ng"}, {"symbol": "nk"}, {"symbol": "a"}]
+
+        assert linguistics.parse_phonemes("nangnka", inventory) == ["a", "ng", "nk", "a"]
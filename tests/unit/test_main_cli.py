@@ -0,0 +1,358 @@
+"""Tests for the top-level CLI in main.py."""
+import os
+import types
+import pytest
+import main
+
+
+@pytest.fixture(autouse=True)
+def _clear_domain_cache():
+    """Make sure every test starts with a fresh domain scan and parser."""
+    main._scan_domain_clis.cache_clear()
+    main._build_parser_for.cache_clear()
+    yield
+    main._scan_domain_clis.cache_clear()
+    main._build_parser_for.cache_clear()
+
+
+def _fake_domains(monkeypatch, tmp_path, *names):
+    """Point the domains directory at a temporary one with the given domains."""
+    for name in names:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "cli.py").write_text("")
+    monkeypatch.setattr(main, "_DOMAINS_PATH", str(tmp_path))
+
+    calls = []
+    real_scandir = main.os.scandir
+
+    def scandir(path):
+        calls.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(main.os, "scandir", scandir)
+    return calls
+
+
+class TestDiscoverDomainClis:
+    """Tests for _discover_domain_clis."""
+
+    def test_returns_domains_with_cli(self, monkeypatch, tmp_path):
+        """Test that only domain packages with a cli.py are returned."""
+        words = types.ModuleType("domains.words")
+        words.cli = types.ModuleType("domains.words.cli")
+        monkeypatch.setitem(main.sys.modules, "domains.words", words)
+        monkeypatch.setitem(main.sys.modules, "domains.words.cli", words.cli)
+        _fake_domains(monkeypatch, tmp_path, "words", "_private")
+        (tmp_path / "plain").mkdir()
+
+        assert main._discover_domain_clis() == (("words", words),)
+
+    def test_cli_package_counts_as_cli(self, monkeypatch, tmp_path):
+        """Test that a domain whose cli is a package directory is returned."""
+        rules = types.ModuleType("domains.rules")
+        rules.cli = types.ModuleType("domains.rules.cli")
+        monkeypatch.setitem(main.sys.modules, "domains.rules", rules)
+        monkeypatch.setitem(main.sys.modules, "domains.rules.cli", rules.cli)
+        _fake_domains(monkeypatch, tmp_path)
+        (tmp_path / "rules" / "cli").mkdir(parents=True)
+        (tmp_path / "rules" / "cli" / "__init__.py").write_text("")
+        (tmp_path / "empty" / "cli").mkdir(parents=True)
+
+        assert main._discover_domain_clis() == (("rules", rules),)
+
+    def test_scan_is_cached(self, monkeypatch, tmp_path):
+        """Test that repeated calls don't rescan the directory."""
+        calls = _fake_domains(monkeypatch, tmp_path)
+
+        main._discover_domain_clis()
+        main._discover_domain_clis()
+        assert len(calls) == 1
+
+        main._scan_domain_clis.cache_clear()
+        main._discover_domain_clis()
+        assert len(calls) == 2
+
+    def test_directory_change_triggers_rescan(self, monkeypatch, tmp_path):
+        """Test that a new modification time invalidates the cached scan."""
+        calls = _fake_domains(monkeypatch, tmp_path)
+        mtimes = iter([1, 1, 2])
+        real_stat = main.os.stat
+        monkeypatch.setattr(main.os, "stat", lambda path: types.SimpleNamespace(st_mtime_ns=next(mtimes))
+                            if path == main._DOMAINS_PATH else real_stat(path))
+
+        main._discover_domain_clis()
+        main._discover_domain_clis()
+        main._discover_domain_clis()
+
+        assert len(calls) == 2
+
+    def test_import_failures_are_skipped(self, monkeypatch, tmp_path):
+        """Test that a domain that fails to import is left out."""
+        _fake_domains(monkeypatch, tmp_path, "missing_domain_for_test")
+
+        assert main._discover_domain_clis() == ()
+
+    def test_missing_domains_directory(self, monkeypatch):
+        """Test that no domains are found when the directory doesn't exist."""
+        monkeypatch.setattr(main, "_DOMAINS_PATH", os.path.join(os.path.dirname(__file__), "no_such_dir"))
+
+        assert main._discover_domain_clis() == ()
+
+
+class TestIterRecipes:
+    """Tests for _iter_recipes."""
+
+    def test_finds_recipe_files_recursively(self, tmp_path):
+        """Test that nested recipe files are found and other files skipped."""
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "a.yaml").write_text("")
+        (tmp_path / "nested" / "b.json").write_text("")
+        (tmp_path / "nested" / "notes.txt").write_text("")
+
+        found = sorted(main._iter_recipes(str(tmp_path)))
+
+        assert found == sorted([str(tmp_path / "a.yaml"), str(tmp_path / "nested" / "b.json")])
+
+
+class TestBuildParser:
+    """Tests for _build_parser."""
+
+    def test_parser_is_reused(self):
+        """Test that the parser is only built once."""
+        assert main._build_parser() is main._build_parser()
+
+    def test_parses_builtin_commands(self):
+        """Test that built-in subcommands are registered."""
+        args = main._build_parser().parse_args(["execute", "--recipe_file", "r.yaml"])
+
+        assert args.command == "execute"
+        assert args.recipe_file == "r.yaml"
+
+    def test_domain_changes_rebuild_parser(self, monkeypatch):
+        """Test that a new domain scan result isn't served a stale parser."""
+        words = types.ModuleType("domains.words")
+        words.cli = types.SimpleNamespace(register_commands=lambda sub: sub.add_parser("words"))
+        domains = [()]
+        monkeypatch.setattr(main, "_discover_domain_clis", lambda: domains[0])
+
+        before = main._build_parser()
+        domains[0] = (("words", words),)
+        after = main._build_parser()
+
+        assert after is not before
+        assert after.parse_args(["words"]).command == "words"
+        assert main._build_parser() is after
+
+
+def _failing_import(error):
+    """Return an import function that raises the given error."""
+    def _import(name):
+        raise error
+    return _import
+
+
+class TestDiscoverDomainClisErrors:
+    """Tests for which domain import errors are tolerated."""
+
+    def test_import_errors_are_skipped(self, monkeypatch, tmp_path):
+        """Test that a domain with a missing dependency is skipped."""
+        _fake_domains(monkeypatch, tmp_path, "broken")
+        monkeypatch.setattr("core.utils.cached_import", _failing_import(ImportError("no dep")))
+
+        assert main._discover_domain_clis() == ()
+
+    def test_other_errors_propagate(self, monkeypatch, tmp_path):
+        """Test that bugs inside a domain are not hidden."""
+        _fake_domains(monkeypatch, tmp_path, "buggy")
+        monkeypatch.setattr("core.utils.cached_import", _failing_import(KeyError("oops")))
+
+        with pytest.raises(KeyError):
+            main._discover_domain_clis()
+
+
+class TestRefreshPlugins:
+    """Tests for the --refresh-plugins flag."""
+
+    def test_invalidates_import_caches_on_request(self, monkeypatch):
+        """Test that the flag invalidates importlib's finder caches."""
+        calls = []
+        monkeypatch.setattr(main.importlib, "invalidate_caches", lambda: calls.append(True))
+        main.main(["domains", "list", "--refresh-plugins"])
+
+        assert calls == [True]
+
+    def test_caches_are_kept_by_default(self, monkeypatch):
+        """Test that normal runs leave the finder caches alone."""
+        calls = []
+        monkeypatch.setattr(main.importlib, "invalidate_caches", lambda: calls.append(True))
+        main.main(["domains", "list"])
+
+        assert calls == []
+
+
+class TestListCommand:
+    """Tests for the list command output."""
+
+    def test_lists_recipes_under_a_header(self, tmp_path, monkeypatch, capsys):
+        """Test that the count is followed by one indented path per recipe."""
+        recipe_dir = tmp_path / "templates" / "recipes"
+        recipe_dir.mkdir(parents=True)
+        (recipe_dir / "a.yaml").write_text("")
+        monkeypatch.chdir(tmp_path)
+
+        main.main(["list"])
+
+        expected_path = "templates/recipes/a.yaml".replace("/", main.os.sep)
+        assert capsys.readouterr().out == f"Found 1 recipes:\n  {expected_path}\n"
+
+
+class TestVerbosity:
+    """Tests for the -v/--verbose flag."""
+
+    @pytest.fixture(autouse=True)
+    def _restore_root_level(self):
+        root = main.logging.getLogger()
+        level = root.level
+        yield
+        root.setLevel(level)
+
+    @pytest.mark.parametrize("flags,level", [(["-v"], main.logging.INFO), (["-vv"], main.logging.DEBUG)])
+    def test_verbose_raises_log_level(self, flags, level):
+        """Test that each -v lowers the root log level."""
+        main.main(flags + ["domains", "list"])
+
+        assert main.logging.getLogger().level == level
+
+
+class TestExecuteTrace:
+    """Tests for the execute --trace flag."""
+
+    @pytest.fixture(autouse=True)
+    def _restore_root_level(self):
+        root = main.logging.getLogger()
+        level = root.level
+        yield
+        root.setLevel(level)
+
+    def test_trace_enables_per_link_logging(self, tmp_path, capsys):
+        """Test that --trace lowers the root level to TRACE."""
+        main.main(["execute", "--recipe_file", str(tmp_path / "missing.yaml"), "--trace"])
+
+        assert main.logging.getLogger().level == main._TRACE
+        assert "Failed to load recipe" in capsys.readouterr().out
+
+
+class TestEnvLogLevel:
+    """Tests for _env_log_level."""
+
+    @pytest.mark.parametrize("value,level", [
+        (None, main.logging.WARNING),
+        ("debug", main.logging.DEBUG),
+        ("TRACE", 15),
+        ("nonsense", main.logging.WARNING),
+    ])
+    def test_level_from_environment(self, monkeypatch, value, level):
+        """Test that the documented variable is honoured and bad names ignored."""
+        monkeypatch.delenv("HOTTOPOTETO_LOGLEVEL", raising=False)
+        if value is None:
+            monkeypatch.delenv("HOTTOPOTETO_LOG_LEVEL", raising=False)
+        else:
+            monkeypatch.setenv("HOTTOPOTETO_LOG_LEVEL", value)
+
+        assert main._env_log_level() == level
+
+
+class TestBuiltinCommandsSkipDomains:
+    """Tests that built-in commands don't trigger domain discovery."""
+
+    def test_requested_command(self):
+        """Test that the subcommand is found past global options."""
+        assert main._requested_command(["-v", "list"]) == "list"
+        assert main._requested_command(["--help"]) is None
+
+    def test_builtin_command_does_not_scan_domains(self, monkeypatch, tmp_path):
+        """Test that running a built-in command never scans for domains."""
+        calls = _fake_domains(monkeypatch, tmp_path)
+
+        main.main(["domains", "list"])
+
+        assert calls == []
+
+    def test_builtin_command_builds_only_its_parser(self):
+        """Test that only the requested built-in subcommand is added."""
+        parser = main._build_parser("list")
+        subparsers = next(a for a in parser._actions if a.dest == "command")
+
+        assert list(subparsers.choices) == ["list"]
+
+
+class TestVerbArgs:
+    """Tests for the option-free verb fast path."""
+
+    @pytest.mark.parametrize("argv", [
+        ["domains", "info", "linguistics"],
+        ["packages", "list"],
+        ["packages", "uninstall", "demo"],
+    ])
+    def test_matches_argparse(self, argv):
+        """Test that the fast path produces the same arguments as argparse."""
+        assert main._verb_args(argv) == main._build_parser(argv[0]).parse_args(argv)
+
+    @pytest.mark.parametrize("argv", [
+        ["domains", "list", "--refresh-plugins"],
+        ["-v", "plugins", "list"],
+        ["domains", "info"],
+        ["plugins", "list", "extra"],
+        ["packages", "install", "demo"],
+        ["execute"],
+    ])
+    def test_falls_back_to_argparse(self, argv):
+        """Test that options, unknown verbs and bad arity go through argparse."""
+        assert main._verb_args(argv) is None
+
+    def test_main_skips_the_parser(self, monkeypatch):
+        """Test that a plain verb is dispatched without building a parser."""
+        seen = []
+        monkeypatch.setitem(main._VERB_COMMANDS, ("domains", "info"), (seen.append, "domain_name"))
+        monkeypatch.setattr(main, "_build_parser", None)
+
+        main.main(["domains", "info", "linguistics"])
+
+        assert seen[0].domain_name == "linguistics"
+
+
+class TestRecipeLinkTypes:
+    """Tests for _recipe_link_types."""
+
+    def test_list_and_dict_links(self):
+        """Test that link types are read from either links layout."""
+        assert main._recipe_link_types({"links": [{"type": "llm"}, {"name": "no type"}]}) == ["llm"]
+        assert main._recipe_link_types({"links": {"A": {"type": "gemini"}}}) == ["gemini"]
+
+
+class TestDomainDispatch:
+    """Tests for _cmd_domain."""
+
+    def _domain(self, name, handled, seen):
+        module = types.ModuleType(f"domains.{name}")
+
+        def handle_command(args):
+            seen.append(name)
+            return handled
+
+        module.cli = types.SimpleNamespace(handle_command=handle_command)
+        return module
+
+    def test_stops_at_the_domain_that_handles_the_command(self, monkeypatch):
+        """Test that domains are tried in turn until one handles the command."""
+        seen = []
+        domains = (
+            ("a", self._domain("a", False, seen)),
+            ("b", self._domain("b", True, seen)),
+            ("c", self._domain("c", True, seen)),
+        )
+        monkeypatch.setattr(main, "_discover_domain_clis", lambda: domains)
+
+        main._cmd_domain(types.SimpleNamespace())
+
+        assert seen == ["a", "b"]
@@ -0,0 +1,65 @@
+"""Tests for the mongodb plugin link handler."""
+import pytest
+from unittest.mock import MagicMock
+from plugins.mongodb import links
+from plugins.mongodb.links import MongoDBLinkHandler
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    """A mocked collection behind a mocked, uncached client."""
+    client = MagicMock()
+    monkeypatch.setattr(links, "_clients", {})
+    monkeypatch.setattr(links, "MongoClient", MagicMock(return_value=client))
+    return client["db"]["items"]
+
+
+def _run(operation, inputs, **config):
+    """Execute a mongodb link with the given inputs."""
+    link_config = {"operation": operation, "database": "db", "collection": "items", "inputs": inputs, **config}
+    return MongoDBLinkHandler.execute(link_config, {})
+
+
+class TestMongoDBHandler:
+    """Tests for MongoDBLinkHandler.execute."""
+
+    def test_client_is_reused_per_uri(self, collection):
+        """Test that repeated links share one client."""
+        _run("find", {})
+        _run("find", {})
+
+        assert links.MongoClient.call_count == 1
+
+    def test_insert_many_documents(self, collection):
+        """Test that a documents list is inserted in one batch."""
+        collection.insert_many.return_value.inserted_ids = [1, 2]
+
+        result = _run("insert", {"documents": [{"a": 1}, {"a": 2}]})
+
+        collection.insert_many.assert_called_once_with([{"a": 1}, {"a": 2}], ordered=False)
+        assert result == {"inserted_ids": ["1", "2"]}
+
+    def test_find_passes_projection_sort_and_limit(self, collection):
+        """Test that find options are applied by the cursor."""
+        cursor = collection.find.return_value
+        cursor.sort.return_value = cursor
+        cursor.limit.return_value = cursor
+        cursor.__iter__.return_value = iter([{"a": 1}])
+
+        result = _run("find", {"a": 1}, projection={"a": 1}, sort=[["a", -1]], limit=5)
+
+        collection.find.assert_called_once_with({"a": 1}, {"a": 1})
+        cursor.sort.assert_called_once_with([("a", -1)])
+        cursor.limit.assert_called_once_with(5)
+        assert result == {"documents": [{"a": 1}]}
+
+    def test_stream_returns_lazy_iterator(self, collection):
+        """Test that stream=True defers fetching and closes the cursor."""
+        cursor = collection.find.return_value
+        cursor.__iter__.return_value = iter([{"a": 1}, {"a": 2}])
+
+        result = _run("find", {}, stream=True)
+
+        cursor.__iter__.assert_not_called()
+        assert list(result["documents"]) == [{"a": 1}, {"a": 2}]
+        cursor.close.assert_called_once()
@@ -0,0 +1,52 @@
+"""Tests for plugin discovery and loading in plugins/__init__.py."""
+import plugins
+
+
+class TestLoadPluginsForLinkTypes:
+    """Tests for load_plugins_for_link_types."""
+
+    def test_loads_only_matching_plugins(self, monkeypatch):
+        """Test that only plugins named by a link type are loaded."""
+        loaded = []
+        monkeypatch.setattr(plugins, "discover_plugins", lambda: ["gemini", "other"])
+        monkeypatch.setattr(plugins, "load_plugin", loaded.append)
+
+        plugins.load_plugins_for_link_types(["llm", "storage.save", "gemini"])
+
+        assert loaded == ["gemini"]
+
+
+class TestDiscoverPlugins:
+    """Tests for discover_plugins."""
+
+    def test_scan_is_cached(self):
+        """Test that repeated discovery returns the cached result."""
+        plugins.discover_plugins.cache_clear()
+
+        assert plugins.discover_plugins() is plugins.discover_plugins()
+
+    def test_finds_plugins_with_manifest(self):
+        """Test that only plugin directories with a manifest are listed."""
+        plugins.discover_plugins.cache_clear()
+
+        assert "gemini" in plugins.discover_plugins()
+        assert "sqlite" not in plugins.discover_plugins()
+
+
+class TestLoadPlugin:
+    """Tests for load_plugin."""
+
+    def test_missing_manifest_returns_none(self):
+        """Test that a plugin without a manifest isn't loaded."""
+        assert plugins.load_plugin("no_such_plugin_for_test") is None
+
+
+class TestReadManifest:
+    """Tests for _read_manifest."""
+
+    def test_keeps_only_known_keys(self, tmp_path):
+        """Test that unrecognised manifest keys are dropped."""
+        path = tmp_path / "manifest.json"
+        path.write_text('{"name": "x", "version": "1.0", "icon": "big blob"}')
+
+        assert plugins._read_manifest(str(path)) == {"name": "x", "version": "1.0"}
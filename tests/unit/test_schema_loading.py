@@ -197,6 +197,23 @@ class TestSchemaLoading:
         
         # Should return the same object (cached)
         assert schema1 is schema2
+    
+    def test_load_schema_reloads_modified_file(self, sample_schema_yaml):
+        """A schema file edited on disk should be reloaded, not served from cache."""
+        from core.schemas import load_schema_file, clear_schema_cache
+        
+        clear_schema_cache()
+        schema1 = load_schema_file(str(sample_schema_yaml))
+        
+        with open(sample_schema_yaml, 'w') as f:
+            yaml.dump({"type": "object", "properties": {"updated": {"type": "string"}}}, f)
+        stat = os.stat(sample_schema_yaml)
+        os.utime(sample_schema_yaml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        schema2 = load_schema_file(str(sample_schema_yaml))
+        
+        assert schema2 is not schema1
+        assert "updated" in schema2["properties"]
 
 
 class TestResolveSchemaReference:
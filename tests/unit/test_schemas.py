@@ -1,6 +1,9 @@
 """Tests for core.schemas module."""
+from collections import OrderedDict
+import jsonschema
 import pytest
-from core.schemas import register_schema, get_schema, list_schemas, _schemas
+from core import schemas
+from core.schemas import register_schema, get_schema, list_schemas, validate_instance, _schemas
 
 
 class TestSchemaRegistry:
@@ -145,3 +148,93 @@ class TestSchemaRegistry:
         assert get_schema("domain.entity") is not None
         assert get_schema("domain.subdomain.entity") is not None
         assert get_schema("domain-with-dashes.entity_underscores") is not None
+
+
+class TestValidateInstance:
+    """Tests for validate_instance."""
+    
+    SCHEMA = {"type": "object", "required": ["name"], "properties": {"name": {"type": "string"}}}
+    
+    def test_valid_instance_passes(self):
+        """Test that valid data raises nothing."""
+        validate_instance({"name": "Ada"}, self.SCHEMA)
+    
+    def test_invalid_instance_raises(self):
+        """Test that invalid data raises like jsonschema.validate."""
+        with pytest.raises(jsonschema.ValidationError):
+            validate_instance({"name": 1}, self.SCHEMA)
+    
+    def test_invalid_schema_raises(self):
+        """Test that a broken schema is still reported."""
+        with pytest.raises(jsonschema.SchemaError):
+            validate_instance({}, {"type": "not-a-type"})
+    
+    def test_validator_is_built_once_per_schema(self, monkeypatch):
+        """Test that repeat validation reuses the compiled validator."""
+        schema = {"type": "string"}
+        checks = []
+        real_validator_for = jsonschema.validators.validator_for
+        
+        def validator_for(s, *args, **kwargs):
+            if s is schema:
+                checks.append(s)
+            return real_validator_for(s, *args, **kwargs)
+        
+        monkeypatch.setattr(jsonschema.validators, "validator_for", validator_for)
+        
+        validate_instance("a", schema)
+        validate_instance("b", schema)
+        
+        assert len(checks) == 1
+    
+    def test_rebuilt_schema_reuses_validator(self, monkeypatch):
+        """Test that an equal schema built as a new object is not compiled again."""
+        built = []
+        real_validator_for = jsonschema.validators.validator_for
+        
+        def validator_for(s, *args, **kwargs):
+            if s.get("title") == "rebuilt":
+                built.append(s)
+            return real_validator_for(s, *args, **kwargs)
+        
+        monkeypatch.setattr(jsonschema.validators, "validator_for", validator_for)
+        
+        for value in ("a", "b", "c"):
+            validate_instance(value, {"title": "rebuilt", "type": "string"})
+        with pytest.raises(jsonschema.ValidationError):
+            validate_instance(1, {"type": "string", "title": "rebuilt"})
+        
+        assert len(built) == 1
+    
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Test that the cache stays bounded and keeps schemas still in use."""
+        monkeypatch.setattr(schemas, "_MAX_VALIDATORS", 4)
+        monkeypatch.setattr(schemas, "_validator_cache", OrderedDict())
+        hot = {"type": "string"}
+        validate_instance("a", hot)
+        
+        for n in range(10):
+            validate_instance(n, {"type": "integer", "minimum": n})
+            validate_instance("a", hot)
+        
+        assert len(schemas._validator_cache) <= 4
+        assert schemas._schema_key(hot) in schemas._validator_cache
+    
+    def test_schema_changed_in_place_is_revalidated(self):
+        """Test that editing a schema dict after use isn't masked by the cache."""
+        schema = {"type": "string"}
+        validate_instance("a", schema)
+        
+        schema["type"] = "integer"
+        
+        validate_instance(1, schema)
+        with pytest.raises(jsonschema.ValidationError):
+            validate_instance("a", schema)
+    
+    def test_clear_schema_cache_drops_validators(self):
+        """Test that clearing the schema cache also clears compiled validators."""
+        validate_instance("a", {"type": "string"})
+        
+        schemas.clear_schema_cache()
+        
+        assert not schemas._validator_cache
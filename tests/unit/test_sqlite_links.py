@@ -0,0 +1,164 @@
+"""Tests for the sqlite plugin link handler."""
+import pytest
+from plugins.sqlite.links import SQLiteHandler, is_read_query, _insert_sql
+
+
+def _run(db_path, operation, **inputs):
+    """Execute a sqlite link with the given inputs."""
+    link_config = {"operation": operation, "database": str(db_path), "inputs": inputs}
+    return SQLiteHandler.execute(link_config, {})
+
+
+@pytest.fixture
+def people_db(tmp_path):
+    """A database with a small people table."""
+    db_path = tmp_path / "people.db"
+    _run(db_path, "create_table", table_name="people",
+         columns=[{"name": "name", "type": "TEXT"}, {"name": "age", "type": "INTEGER"}])
+    _run(db_path, "insert", table_name="people", data={"name": "Ada", "age": 36})
+    _run(db_path, "insert", table_name="people", data={"name": "Alan", "age": 41})
+    return db_path
+
+
+class TestIsReadQuery:
+    """Tests for read-only statement detection."""
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT * FROM t",
+        "  select 1",
+        "-- comment\nSELECT 1",
+        "/* block */ EXPLAIN SELECT 1",
+        "VALUES (1)",
+    ])
+    def test_read_statements(self, sql):
+        """Test statements that are read-only."""
+        assert is_read_query(sql)
+
+    @pytest.mark.parametrize("sql", [
+        "INSERT INTO t VALUES (1)",
+        "UPDATE t SET a = 1",
+        "WITH x AS (SELECT 1) DELETE FROM t",
+        "PRAGMA user_version = 3",
+        "-- SELECT\nDELETE FROM t",
+        "SELECTED",
+    ])
+    def test_write_or_ambiguous_statements(self, sql):
+        """Test statements that may write are not treated as reads."""
+        assert not is_read_query(sql)
+
+
+class TestInsertSql:
+    """Tests for the cached INSERT statement builder."""
+
+    def test_positional_and_named(self):
+        """Test both placeholder styles."""
+        assert _insert_sql("t", ("a", "b")) == "INSERT INTO t (a, b) VALUES (?, ?)"
+        assert _insert_sql("t", ("a", "b"), named=True) == "INSERT INTO t (a, b) VALUES (:a, :b)"
+
+    def test_statement_is_reused(self):
+        """Test that the same table and columns return the cached string."""
+        assert _insert_sql("people", ("name",)) is _insert_sql("people", ("name",))
+
+
+class TestSQLiteHandler:
+    """Tests for SQLiteHandler.execute."""
+
+    def test_query_returns_rows(self, people_db):
+        """Test that a select query returns rows as dicts."""
+        result = _run(people_db, "query", sql="SELECT name, age FROM people ORDER BY age")
+
+        assert result == {"rows": [{"name": "Ada", "age": 36}, {"name": "Alan", "age": 41}]}
+
+    def test_query_in_column_format(self, people_db):
+        """Test that row_format=columns returns names once and row tuples."""
+        link_config = {"operation": "query", "database": str(people_db), "row_format": "columns",
+                       "inputs": {"sql": "SELECT name, age FROM people ORDER BY age"}}
+
+        result = SQLiteHandler.execute(link_config, {})
+
+        assert result == {"columns": ["name", "age"], "data": [("Ada", 36), ("Alan", 41)]}
+
+    def test_query_with_params(self, people_db):
+        """Test that query parameters are bound."""
+        result = _run(people_db, "query", sql="SELECT name FROM people WHERE age > ?", params=[40])
+
+        assert result == {"rows": [{"name": "Alan"}]}
+
+    def test_update_modifies_rows(self, people_db):
+        """Test that updates are committed."""
+        result = _run(people_db, "update", sql="UPDATE people SET age = age + 1")
+        assert result == {"modified_count": 2}
+
+        rows = _run(people_db, "query", sql="SELECT age FROM people ORDER BY age")["rows"]
+        assert [row["age"] for row in rows] == [37, 42]
+
+    def test_delete_removes_rows(self, people_db):
+        """Test that deletes are committed."""
+        result = _run(people_db, "delete", table_name="people", condition="name = ?", params=["Ada"])
+        assert result == {"deleted_count": 1}
+
+        rows = _run(people_db, "query", sql="SELECT name FROM people")["rows"]
+        assert rows == [{"name": "Alan"}]
+
+    def test_insert_many_rows(self, people_db):
+        """Test that a list of rows is inserted in one operation."""
+        result = _run(people_db, "insert", table_name="people",
+                      data=[{"name": "Grace", "age": 45}, {"age": 50, "name": "Edsger"}])
+        assert result == {"inserted_count": 2}
+
+        rows = _run(people_db, "query", sql="SELECT name FROM people WHERE age >= 45 ORDER BY age")["rows"]
+        assert rows == [{"name": "Grace"}, {"name": "Edsger"}]
+
+    def test_insert_many_rolls_back_on_error(self, people_db):
+        """Test that a bad row leaves none of the batch inserted."""
+        result = _run(people_db, "insert", table_name="people",
+                      data=[{"name": "Grace", "age": 45}, {"name": "NoAge"}])
+        assert "error" in result
+
+        rows = _run(people_db, "query", sql="SELECT name FROM people WHERE name = 'Grace'")["rows"]
+        assert rows == []
+
+    def test_sql_errors_are_reported(self, people_db):
+        """Test that SQL errors are returned as an error result."""
+        result = _run(people_db, "query", sql="SELECT * FROM missing")
+
+        assert "error" in result
+
+
+class TestProcessTemplate:
+    """Tests for SQLiteHandler._process_template."""
+
+    def test_substitutes_top_level_and_data_references(self):
+        """Test both plain and Link.data.field placeholders."""
+        context = {"table": "people", "Inputs": {"raw": None, "data": {"name": "Ada"}}}
+        template = "SELECT * FROM {{ table }} WHERE name = '{{ Inputs.data.name }}'"
+
+        result = SQLiteHandler._process_template(template, context)
+
+        assert result == "SELECT * FROM people WHERE name = 'Ada'"
+
+    def test_unknown_placeholders_are_left_alone(self):
+        """Test that unresolved placeholders stay in the output."""
+        result = SQLiteHandler._process_template("{{ missing.data.x }}", {"missing": {"data": "text"}})
+
+        assert result == "{{ missing.data.x }}"
+
+    def test_non_strings_pass_through(self):
+        """Test that non-string inputs are returned unchanged."""
+        data = {"name": "{{ x }}"}
+        assert SQLiteHandler._process_template(data, {"x": 1}) is data
+
+
+class TestSQLiteErrorHandling:
+    """Tests for which errors are reported versus raised."""
+
+    def test_missing_inputs_are_reported(self, tmp_path):
+        """Test that configuration errors are returned as an error result."""
+        result = _run(tmp_path / "t.db", "insert", table_name="people")
+
+        assert result == {"error": "Table name and data required for insert"}
+
+    def test_unexpected_errors_propagate(self, tmp_path):
+        """Test that programming errors are not swallowed."""
+        with pytest.raises(KeyError):
+            _run(tmp_path / "t.db", "create_table", table_name="people", columns=[{"type": "TEXT"}])
@@ -0,0 +1,358 @@
+"""
+Unit tests for storage domain adapters and the Repository that wraps them
+"""
+import json
+import os
+import sqlite3
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from core.domains.storage import models, utils
+from core.domains.storage.models import StorageAdapter, FileAdapter, SQLiteAdapter
+from core.domains.storage.functions import Repository, save_entity
+from core.domains.storage.utils import dumps_json, loads_json, safe_save_json
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    adapter = SQLiteAdapter(collection="words", db_path=str(tmp_path / "storage.db"))
+    yield adapter
+    adapter.close()
+
+
+class TestStorageJson:
+    """Tests for the JSON helpers the adapters share, with and without orjson"""
+
+    @pytest.fixture(autouse=True, params=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(utils, "orjson", None)
+        return request.param
+
+    def test_round_trip_preserves_unicode(self):
+        data = {"word": "Skryvnariel", "gloss": "世界 🎉", "n": [1, 2.5, None]}
+        encoded = dumps_json(data)
+        assert "世界".encode("utf-8") in encoded
+        assert loads_json(encoded) == data
+
+    def test_default_indent_matches_stdlib_layout(self):
+        data = {"a": {"b": [1, 2]}}
+        assert dumps_json(data, indent=2).decode() == json.dumps(data, indent=2)
+
+    def test_other_indents_and_non_string_keys_fall_back(self):
+        assert b"    " in dumps_json({"k": "v"}, indent=4)
+        assert loads_json(dumps_json({1: "one"})) == {"1": "one"}
+
+    def test_file_adapter_indent_setting(self, tmp_path):
+        pretty = FileAdapter(collection="pretty", base_dir=str(tmp_path))
+        compact = FileAdapter(collection="compact", base_dir=str(tmp_path), indent=None)
+        pretty.save("a", {"k": [1, 2]})
+        compact.save("a", {"k": [1, 2]})
+        assert (tmp_path / "pretty" / "a.json").read_text() == json.dumps({"k": [1, 2]}, indent=2)
+        assert (tmp_path / "compact" / "a.json").read_bytes() == dumps_json({"k": [1, 2]})
+        assert compact.get("a") == {"k": [1, 2]}
+
+    def test_save_replaces_file_without_leaving_temp_files(self, tmp_path):
+        path = tmp_path / "entity.json"
+        assert safe_save_json(str(path), {"v": 1}) is True
+        assert safe_save_json(str(path), {"v": 2}) is True
+        assert json.loads(path.read_text()) == {"v": 2}
+        assert [p.name for p in tmp_path.iterdir()] == ["entity.json"]
+
+    def test_failed_save_keeps_previous_version(self, tmp_path):
+        path = tmp_path / "entity.json"
+        safe_save_json(str(path), {"v": 1})
+        assert safe_save_json(str(path), {"v": object()}) is False
+        assert json.loads(path.read_text()) == {"v": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["entity.json"]
+
+    def test_non_finite_floats(self, backend, tmp_path):
+        data = {"v": float("nan"), "w": float("inf")}
+        if backend == "orjson":
+            assert loads_json(dumps_json(data)) == {"v": None, "w": None}
+        else:
+            with pytest.raises(ValueError):
+                dumps_json(data)
+            assert safe_save_json(str(tmp_path / "entity.json"), data) is False
+
+    def test_file_adapter_round_trip(self, tmp_path):
+        adapter = FileAdapter(collection="words", base_dir=str(tmp_path))
+        assert adapter.save("w-1", {"data": {"word": "skryv"}}) is True
+        assert adapter.get("w-1") == {"data": {"word": "skryv"}}
+        assert adapter.query({"data.word": "skryv"}) == [{"data": {"word": "skryv"}}]
+
+
+class TestFileAdapterQuery:
+    """Tests for the parse cache behind FileAdapter.query"""
+
+    @pytest.fixture
+    def adapter(self, tmp_path):
+        adapter = FileAdapter(collection="words", base_dir=str(tmp_path))
+        adapter.save("a", {"pos": "noun", "word": "skryv"})
+        adapter.save("b", {"pos": "verb", "word": "kre"})
+        return adapter
+
+    def test_unchanged_files_are_not_reparsed(self, adapter):
+        adapter.query({})
+        with patch.object(models, "safe_load_json") as mock_load:
+            assert adapter.query({"pos": "noun"}) == [{"pos": "noun", "word": "skryv"}]
+        mock_load.assert_not_called()
+
+    def test_rewritten_file_is_reloaded(self, adapter, tmp_path):
+        adapter.query({})
+        (tmp_path / "words" / "b.json").write_text('{"pos": "noun", "word": "kreval"}')
+        words = sorted(e["word"] for e in adapter.query({"pos": "noun"}))
+        assert words == ["kreval", "skryv"]
+
+    def test_results_do_not_alias_the_cache(self, adapter):
+        adapter.query({"pos": "noun"})[0]["word"] = "changed"
+        assert adapter.query({"pos": "noun"}) == [{"pos": "noun", "word": "skryv"}]
+
+    def test_cache_is_bounded_least_recently_used_first(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(models, "_entity_cache", models.OrderedDict())
+        monkeypatch.setattr(models, "_entity_dirs", {})
+        monkeypatch.setattr(models, "_MAX_CACHED_ENTITIES", 3)
+        adapter = FileAdapter(collection="lru", base_dir=str(tmp_path))
+        paths = {name: str(tmp_path / "lru" / f"{name}.json") for name in "abcd"}
+        for name, path in paths.items():
+            adapter.save(name, {"n": name})
+            models._load_cached(path, os.stat(path))
+        models._load_cached(paths["b"], os.stat(paths["b"]))
+
+        cached = [os.path.basename(path) for path in models._entity_cache]
+        assert cached == ["c.json", "d.json", "b.json"]
+        assert models._entity_dirs == {str(tmp_path / "lru"): set(models._entity_cache)}
+
+    def test_files_deleted_outside_the_adapter_leave_the_cache(self, adapter, tmp_path):
+        adapter.query({})
+        (tmp_path / "words" / "b.json").unlink()
+
+        assert adapter.query({}) == [{"pos": "noun", "word": "skryv"}]
+        assert str(tmp_path / "words" / "b.json") not in models._entity_cache
+        assert str(tmp_path / "words" / "a.json") in models._entity_cache
+
+    def test_queries_only_evict_their_own_collection(self, adapter, tmp_path):
+        other = FileAdapter(collection="other", base_dir=str(tmp_path))
+        other.save("x", {"n": 1})
+        other.query({})
+        (tmp_path / "other" / "x.json").unlink()
+
+        adapter.query({})
+        assert str(tmp_path / "other" / "x.json") in models._entity_cache
+
+        assert other.query({}) == []
+        assert str(tmp_path / "other" / "x.json") not in models._entity_cache
+
+    def test_top_level_criteria_are_checked_before_nested_ones(self, adapter):
+        adapter.save("c", {"pos": "particle", "data": 5})
+        with patch.object(models.logger, "error") as mock_error:
+            results = adapter.query({"data.gloss": "x", "pos": "noun"})
+        assert results == []
+        mock_error.assert_not_called()
+
+    def test_large_reload_uses_thread_pool(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(models, "_PARALLEL_LOAD_MIN", 2)
+        adapter = FileAdapter(collection="bulk", base_dir=str(tmp_path))
+        adapter.save_many({f"w{i}": {"n": i} for i in range(5)})
+        with patch.object(models, "ThreadPoolExecutor", wraps=models.ThreadPoolExecutor) as pool:
+            assert sorted(e["n"] for e in adapter.query({})) == [0, 1, 2, 3, 4]
+            pool.assert_called_once()
+            # Everything is cached now, so nothing is reloaded
+            assert len(adapter.query({})) == 5
+            pool.assert_called_once()
+
+    def test_get_reuses_parsed_file_until_it_changes(self, adapter, tmp_path):
+        assert adapter.get("a") == {"pos": "noun", "word": "skryv"}
+        with patch.object(models, "safe_load_json") as mock_load:
+            entity = adapter.get("a")
+        mock_load.assert_not_called()
+
+        entity["word"] = "changed"
+        assert adapter.get("a")["word"] == "skryv"
+
+        (tmp_path / "words" / "a.json").write_text('{"pos": "noun", "word": "skryval"}')
+        assert adapter.get("a")["word"] == "skryval"
+
+    def test_missing_collection_returns_empty(self, tmp_path):
+        assert FileAdapter(collection="none", base_dir=str(tmp_path)).query({}) == []
+
+
+class TestSQLiteAdapter:
+    """Tests for the SQLite-backed adapter"""
+
+    def test_registered_as_sqlite(self):
+        assert StorageAdapter.get("sqlite") is SQLiteAdapter
+
+    def test_save_get_delete_round_trip(self, adapter):
+        entity = {"id": "w-1", "data": {"word": "skryv", "tags": ["noun"]}}
+        assert adapter.save("w-1", entity) is True
+        assert adapter.get("w-1") == entity
+
+        assert adapter.delete("w-1") is True
+        assert adapter.get("w-1") is None
+        assert adapter.delete("w-1") is False
+
+    def test_save_replaces_existing_entry(self, adapter):
+        adapter.save("w-1", {"data": {"word": "old"}})
+        adapter.save("w-1", {"data": {"word": "new"}})
+        assert adapter.query({}) == [{"data": {"word": "new"}}]
+
+    def test_collections_are_isolated(self, adapter):
+        other = SQLiteAdapter(collection="other", db_path=adapter.db_path)
+        adapter.save("x", {"n": 1})
+        other.save("x", {"n": 2})
+        assert adapter.get("x") == {"n": 1}
+        assert other.get("x") == {"n": 2}
+        other.close()
+
+    def test_close_releases_connection_and_reopens_on_use(self, adapter):
+        adapter.save("x", {"n": 1})
+        conn = adapter._connection
+        adapter.close()
+        assert adapter._connection is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert adapter.get("x") == {"n": 1}
+
+    def test_connection_is_shared_across_threads(self, adapter):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert all(pool.map(lambda i: adapter.save(f"w{i}", {"n": i}), range(20)))
+        assert len(adapter.query({})) == 20
+
+    def test_save_many_writes_all_entries(self, adapter):
+        assert adapter.save_many({"a": {"n": 1}, "b": {"n": 2}}) is True
+        assert [e["n"] for e in adapter.query({})] == [1, 2]
+
+    def test_query_matches_nested_scalar_fields(self, adapter):
+        adapter.save("a", {"data": {"pos": "noun", "syllables": 2}})
+        adapter.save("b", {"data": {"pos": "verb", "syllables": 2}})
+        adapter.save("c", {"data": {"pos": "noun", "syllables": 3}})
+
+        results = adapter.query({"data.pos": "noun", "data.syllables": 2})
+        assert results == [{"data": {"pos": "noun", "syllables": 2}}]
+
+    def test_query_non_scalar_criteria_match_like_file_adapter(self, adapter):
+        adapter.save("a", {"active": True, "tags": ["x"], "note": None})
+        adapter.save("b", {"active": False, "tags": ["y"]})
+
+        assert [r["tags"] for r in adapter.query({"active": True})] == [["x"]]
+        assert [r["tags"] for r in adapter.query({"tags": ["y"]})] == [["y"]]
+        assert [r["tags"] for r in adapter.query({"note": None})] == [["x"]]
+
+    @pytest.mark.parametrize("criteria", [
+        {"tags": '["x"]'},
+        {"meta": '{"n": 1}'},
+        {"tags": "x"},
+    ])
+    def test_string_criteria_do_not_match_json_text_of_containers(self, adapter, tmp_path, criteria):
+        entity = {"tags": ["x"], "meta": {"n": 1}}
+        file_adapter = FileAdapter(collection="words", base_dir=str(tmp_path / "files"))
+        for store in (adapter, file_adapter):
+            store.save("a", entity)
+        assert adapter.query(criteria) == file_adapter.query(criteria) == []
+
+    @pytest.mark.parametrize("criteria", [
+        {"a[0]": 2},
+        {"$x": 2},
+        {"nested.b[1]": 3},
+        {'say "hi"': 4},
+    ])
+    def test_keys_with_json_path_syntax_match_like_file_adapter(self, adapter, tmp_path, criteria):
+        entity = {"a[0]": 2, "$x": 2, "nested": {"b[1]": 3}, 'say "hi"': 4}
+        file_adapter = FileAdapter(collection="words", base_dir=str(tmp_path / "files"))
+        for store in (adapter, file_adapter):
+            store.save("a", entity)
+            store.save("b", {"other": True})
+        assert adapter.query(criteria) == file_adapter.query(criteria) == [entity]
+
+    def test_get_missing_entity_is_none_like_file_adapter(self, adapter, tmp_path):
+        file_adapter = FileAdapter(collection="words", base_dir=str(tmp_path / "files"))
+        assert adapter.get("missing") is None
+        assert file_adapter.get("missing") is None
+
+    def test_query_handles_quotes_in_keys(self, adapter):
+        adapter.save("a", {"it's": "x"})
+        assert adapter.query({"it's": "x"}) == [{"it's": "x"}]
+
+    def test_indexing_a_field_with_double_quotes_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="double quotes"):
+            SQLiteAdapter(collection="words", db_path=str(tmp_path / "idx.db"),
+                          indexed_fields=['say "hi"'])
+
+    def test_indexed_fields_are_used_by_queries(self, tmp_path):
+        adapter = SQLiteAdapter(collection="words", db_path=str(tmp_path / "idx.db"),
+                                indexed_fields=["data.pos"])
+        adapter.save("a", {"data": {"pos": "noun"}})
+        assert adapter.query({"data.pos": "noun"}) == [{"data": {"pos": "noun"}}]
+
+        plan = adapter._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM entries "
+            "WHERE collection = ? AND json_extract(data, '$.\"data\".\"pos\"') = ?",
+            ("words", "noun"),
+        ).fetchall()
+        index_name = "entries_" + "data.pos".encode().hex()
+        assert any(index_name in row[-1] for row in plan)
+        adapter.close()
+
+
+class TestRepositoryAdapterSelection:
+    """Tests for how Repository chooses its adapter"""
+
+    def test_defaults_to_file_adapter(self, monkeypatch):
+        monkeypatch.delenv("HOTTOPOTETO_STORAGE_ADAPTER", raising=False)
+        assert Repository("words").adapter.name == "file"
+
+    def test_env_var_selects_adapter(self, monkeypatch):
+        monkeypatch.setenv("HOTTOPOTETO_STORAGE_ADAPTER", "sqlite")
+        with Repository("words") as repo:
+            assert isinstance(repo.adapter, SQLiteAdapter)
+
+    def test_adapter_options_are_passed_through(self, tmp_path):
+        with Repository("words", adapter_name="sqlite",
+                        adapter_options={"db_path": str(tmp_path / "r.db")}) as repo:
+            assert repo.adapter.db_path == str(tmp_path / "r.db")
+
+    @pytest.mark.parametrize("adapter_name", ["file", "sqlite"])
+    def test_get_missing_entity_is_none_for_every_adapter(self, tmp_path, adapter_name):
+        option = "base_dir" if adapter_name == "file" else "db_path"
+        with Repository("words", adapter_name=adapter_name,
+                        adapter_options={option: str(tmp_path / "store")}) as repo:
+            assert repo.get("missing") is None
+
+    @pytest.mark.parametrize("adapter_name", ["file", "sqlite"])
+    def test_save_many(self, tmp_path, adapter_name):
+        option = "base_dir" if adapter_name == "file" else "db_path"
+        with Repository("words", adapter_name=adapter_name,
+                        adapter_options={option: str(tmp_path / "store")}) as repo:
+            assert repo.save_many({"a": {"n": 1}, "b": {"n": 2}}) is True
+            assert sorted(e["n"] for e in repo.query()) == [1, 2]
+
+    def test_unknown_adapter_raises(self):
+        with pytest.raises(ValueError, match="not found"):
+            Repository("words", adapter_name="missing")
+
+
+class TestSaveEntity:
+    """Tests for the save_entity domain function"""
+
+    @pytest.fixture(autouse=True)
+    def in_tmp_dir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("HOTTOPOTETO_STORAGE_ADAPTER", raising=False)
+
+    @pytest.mark.parametrize("filename, expected", [
+        ("my word", "my-word"),
+        ("a -- b!!c", "a-b-c"),
+        ("--lead_and_trail--", "lead_and_trail"),
+        ("kept-as_is", "kept-as_is"),
+    ])
+    def test_filename_is_sanitized_into_id(self, filename, expected):
+        result = save_entity("words", {"n": 1}, filename=filename)
+        assert result["data"]["id"] == expected
+
+    def test_generated_id_uses_collection_prefix(self):
+        result = save_entity("Words", {"n": 1})
+        prefix, suffix = result["data"]["id"].split("-")
+        assert prefix == "words" and len(suffix) == 8
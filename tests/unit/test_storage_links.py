@@ -384,5 +384,34 @@ class TestStorageSaveLink:
             assert "{{" not in str(saved_metadata)
 
 
+class TestStorageLinkRegistration:
+    """Test that the storage links are registered together"""
+
+    def test_all_storage_link_types_registered(self):
+        """Test that every storage link type resolves to its handler"""
+        from core.links import get_link_handler
+        from core.domains.storage import links
+
+        assert get_link_handler("storage.save") is links.StorageSaveLink
+        assert get_link_handler("storage.update") is links.StorageUpdateLink
+
+
+class TestStorageTemplateCache:
+    """Test that storage templates are compiled once"""
+
+    def test_same_source_reuses_compiled_template(self):
+        """Test that rendering the same source twice compiles it once"""
+        from core.domains.storage.links import _compile_template
+
+        assert _compile_template("{{ a }}-cache") is _compile_template("{{ a }}-cache")
+        assert _compile_template("{{ a }}-cache", strict=False) is not _compile_template("{{ a }}-cache")
+
+    def test_now_helper_available(self):
+        """Test that now() is still available to storage templates"""
+        result = StorageSaveLink._extract_data("{{ now()[:2] }}", {})
+
+        assert result == "20"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
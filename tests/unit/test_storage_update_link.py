@@ -284,6 +284,41 @@ class TestStorageUpdateSchemaValidation:
         # Should report validation error
         assert result["data"].get("success") is False or "error" in result["data"]
     
+    @patch('core.domains.storage.links.Repository')
+    def test_validator_is_built_once_for_a_stored_schema(self, mock_repo_class):
+        """Equal schemas loaded fresh on each update should share one validator."""
+        from jsonschema import validators
+
+        mock_repo = MagicMock()
+        mock_repo_class.return_value = mock_repo
+        mock_repo.get.side_effect = lambda _id: {
+            "id": "doc-123",
+            "data": {"name": "Test"},
+            "metadata": {"schema": {"type": "object", "properties": {"tag": {"const": "shared-validator"}}}}
+        }
+        mock_repo.save.return_value = True
+        config = {
+            "type": "storage.update",
+            "document_id": "doc-123",
+            "collection": "test_collection",
+            "data": {"tag": "shared-validator"}
+        }
+
+        original = validators.validator_for
+        built = []
+
+        def counting_validator_for(schema, *args, **kwargs):
+            if isinstance(schema, dict) and "tag" in schema.get("properties", {}):
+                built.append(schema)
+            return original(schema, *args, **kwargs)
+
+        with patch.object(validators, "validator_for", counting_validator_for):
+            for _ in range(3):
+                result = StorageUpdateLink.execute(config, {})
+                assert result["data"].get("success", True) is not False
+
+        assert len(built) <= 1
+
     @patch('core.domains.storage.links.Repository')
     def test_succeeds_with_no_schema(self, mock_repo_class):
         """Should succeed when document has no schema (no validation)."""
@@ -499,6 +534,7 @@ class TestStorageUpdatePersistence:
         saved_entity = mock_repo.save.call_args[0][1]
         assert saved_entity["metadata"]["initialized_at"] == "2025-01-01T00:00:00"
         assert "updated_at" in saved_entity["metadata"]
+        assert saved_entity["metadata"]["updated_at"] == saved_entity["timestamp"]
 
 
 # ==============================================================================
@@ -1,7 +1,9 @@
 """Tests for core.utils module."""
 import pytest
 import os
+import sys
 import json
+import types
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -10,7 +12,8 @@ from core.utils import (
     generate_id,
     safe_load_json,
     safe_save_json,
-    format_timestamp
+    format_timestamp,
+    cached_import
 )
 
 
@@ -184,3 +187,18 @@ class TestFormatTimestamp:
         result = format_timestamp(timestamp_str)
         
         assert isinstance(result, str)
+
+
+class TestCachedImport:
+    """Tests for cached_import function."""
+
+    def test_returns_loaded_module(self, monkeypatch):
+        """Test that modules already in sys.modules are returned as-is."""
+        fake = types.ModuleType("already_loaded_for_test")
+        monkeypatch.setitem(sys.modules, "already_loaded_for_test", fake)
+
+        assert cached_import("already_loaded_for_test") is fake
+
+    def test_imports_missing_module(self):
+        """Test that other modules are imported normally."""
+        assert cached_import("json") is json